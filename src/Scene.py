@@ -1,6 +1,7 @@
 import os
 import math
 import random
+import numpy as np
 from PIL import Image
 from typing import List, Optional, Tuple, Union
 from elements import Element, TextElement, ImageElement
@@ -11,6 +12,8 @@ class Scene:
     Represents a scene with a specified width, height, and a list of objects.
     """
 
+    __slots__ = ("_width", "_height", "elements", "image")
+
     def __init__(
         self,
         width: int,
@@ -28,6 +31,7 @@ class Scene:
         self.width = width
         self.height = height
         self.elements = elements if elements is not None else []
+        self.image = None
 
     @property
     def dict(self):
@@ -144,9 +148,44 @@ class Scene:
             or bottom1 + minimum_distance < top2
         )
 
+    @staticmethod
+    def are_boxes_touching(
+        boxes1: np.ndarray,
+        boxes2: np.ndarray,
+        minimum_distance: Union[int, float] = 0,
+    ) -> np.ndarray:
+        """
+        Vectorized is_box_touching for every pair of boxes from two sets.
+
+        Args:
+            boxes1: (n, 4) array of (left, top, right, bottom) boxes.
+            boxes2: (m, 4) array of (left, top, right, bottom) boxes.
+            minimum_distance: The minimum allowed distance between boxes.
+
+        Returns:
+            (n, m) boolean array, True where boxes2[j] touches boxes1[i].
+        """
+        boxes1 = np.asarray(boxes1, dtype=float)
+        boxes2 = np.asarray(boxes2, dtype=float)
+        if boxes1.ndim != 2 or boxes1.shape[1] != 4:
+            raise ValueError("Boxes must be an array of shape (n, 4).")
+        if boxes2.ndim != 2 or boxes2.shape[1] != 4:
+            raise ValueError("Boxes must be an array of shape (m, 4).")
+
+        left1, top1, right1, bottom1 = (boxes1[:, i, None] for i in range(4))
+        left2, top2, right2, bottom2 = boxes2.T
+
+        return ~(
+            (right2 + minimum_distance < left1)
+            | (right1 + minimum_distance < left2)
+            | (bottom2 + minimum_distance < top1)
+            | (bottom1 + minimum_distance < top2)
+        )
+
     @staticmethod
     def _validate_element(element: object) -> None:
-        if not isinstance(element, (Element, TextElement, ImageElement)):
+        # TextElement and ImageElement subclass Element, one check covers all
+        if not isinstance(element, Element):
             raise TypeError("Object must be an Element or a subclass of Element.")
 
     def create_image(
@@ -216,56 +255,227 @@ class Scene:
         """
         self._validate_element(element)
 
-        for _ in range(int(max_attempts)):
-            if constrain_to_artboard:
-                if (artboard_margin * 2) >= self.height or (
-                    artboard_margin * 2
-                ) >= self.width:
-                    raise ValueError("Margin is too large for the artboard dimensions.")
-                left, top, right, bottom = (
-                    element.bounding_box
-                )  # (left, top, right, bottom)
-                x = random.uniform(
-                    -left + artboard_margin, self.width - right - artboard_margin
-                )
-                y = random.uniform(
-                    -top + artboard_margin, self.height - bottom - artboard_margin
-                )
-            else:
-                x = random.uniform(0, self.width)
-                y = random.uniform(0, self.height)
-
-            if not collision:
-                element.position = (x, y)
-                return (x, y)
-
+        # Everything but the sampled position is fixed across attempts
+        width, height = self._width, self._height
+        rand = random.random
+        if constrain_to_artboard:
+            if (artboard_margin * 2) >= height or (artboard_margin * 2) >= width:
+                raise ValueError("Margin is too large for the artboard dimensions.")
+            left, top, right, bottom = element.bounding_box
+            x_range = (-left + artboard_margin, width - right - artboard_margin)
+            y_range = (-top + artboard_margin, height - bottom - artboard_margin)
+        else:
+            x_range = (0, width)
+            y_range = (0, height)
+        # random.uniform(a, b) is a + (b - a) * random(), spelled out so each
+        # draw is one call with the offsets and spans computed once
+        x_low, x_span = x_range[0], x_range[1] - x_range[0]
+        y_low, y_span = y_range[0], y_range[1] - y_range[0]
+
+        if collision:
             if scene_elements is None:
                 scene_elements = self.elements
-
             if minimum_distance is None:
                 minimum_distance = 0
 
-            collided = False
-            for scene_element in scene_elements:
-                if scene_element is element:
-                    continue
-                if self.is_box_touching(
-                    element.calculate_absolute_box((x, y), element.bounding_box),
-                    scene_element.absolute_bounding_box,
-                    minimum_distance,
-                ):
-                    collided = True
-                    break
-
-            if not collided:
-                element.position = (x, y)
+            # The other elements stay put while this one looks for a spot,
+            # so gather their boxes once
+            bounding_box = element.bounding_box
+            others = np.array(
+                [
+                    scene_element.absolute_bounding_box
+                    for scene_element in scene_elements
+                    if scene_element is not element
+                ],
+                dtype=float,
+            ).reshape(-1, 4)
+            collision = others.size > 0
+
+        attempts = int(max_attempts)
+        if attempts < 1:
+            return None
+
+        if not collision:
+            # x and y are floats from random(), no need for the setter
+            x = x_low + x_span * rand()
+            y = y_low + y_span * rand()
+            element._position = (x, y)
+            return (x, y)
+
+        # Try a plain uniform sample first, most placements in a sparse scene
+        # fit straight away
+        attempts -= 1
+        x = x_low + x_span * rand()
+        y = y_low + y_span * rand()
+        if not self._collides((x, y), bounding_box, others, minimum_distance):
+            element._position = (x, y)
+            return (x, y)
+
+        # Otherwise sample straight from the free space. A position collides
+        # with another box when it lies inside that box grown by this element's
+        # bounding box and the minimum distance, so those grown boxes are
+        # exactly the positions to avoid.
+        left, top, right, bottom = bounding_box
+        forbidden = others + (
+            -minimum_distance - right,
+            -minimum_distance - bottom,
+            minimum_distance - left,
+            minimum_distance - top,
+        )
+        xs, ys, cumulative_area = self._free_cells(
+            sorted(x_range), sorted(y_range), forbidden
+        )
+        if not cumulative_area.size or cumulative_area[-1] <= 0:
+            return None
+
+        while attempts > 0:
+            attempts -= 1
+            index = int(
+                np.searchsorted(
+                    cumulative_area, cumulative_area[-1] * rand(), side="right"
+                )
+            )
+            row, column = divmod(min(index, cumulative_area.size - 1), len(xs) - 1)
+            x = float(xs[column] + (xs[column + 1] - xs[column]) * rand())
+            y = float(ys[row] + (ys[row + 1] - ys[row]) * rand())
+
+            # A sample can still land on the edge of a grown box
+            if not self._collides((x, y), bounding_box, others, minimum_distance):
+                element._position = (x, y)
                 return (x, y)
 
         return None
 
+    @staticmethod
+    def _collides(
+        position: Tuple[float, float],
+        bounding_box: Tuple[float, float, float, float],
+        others: np.ndarray,
+        minimum_distance: Union[int, float],
+    ) -> bool:
+        x, y = position
+        left, top, right, bottom = bounding_box
+        return bool(
+            (
+                (others[:, 0] <= x + right + minimum_distance)
+                & (x + left <= others[:, 2] + minimum_distance)
+                & (others[:, 1] <= y + bottom + minimum_distance)
+                & (y + top <= others[:, 3] + minimum_distance)
+            ).any()
+        )
+
+    @staticmethod
+    def _free_cells(
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        forbidden: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Splits the sampling area into the grid formed by the edges of the
+        forbidden boxes and weighs each cell by its area, or 0 if a box covers it.
+
+        Args:
+            x_range: (low, high) range of x positions.
+            y_range: (low, high) range of y positions.
+            forbidden: (n, 4) array of (left, top, right, bottom) boxes to avoid.
+
+        Returns:
+            The column edges, the row edges and the cumulative free area of the
+            cells in row-major order. An axis with an empty range is treated as
+            a single cell of width 1 so that its other axis can still be sampled.
+        """
+        edges = []
+        for axis, (low, high) in enumerate((x_range, y_range)):
+            lines = np.clip(forbidden[:, [axis, axis + 2]].ravel(), low, high)
+            axis_edges = np.unique(np.concatenate(([low, high], lines)))
+            if len(axis_edges) == 1:
+                axis_edges = np.array([low, high], dtype=float)
+            edges.append(axis_edges)
+        xs, ys = edges
+
+        widths = np.diff(xs) if xs[-1] > xs[0] else np.ones(1)
+        heights = np.diff(ys) if ys[-1] > ys[0] else np.ones(1)
+        column_centers = (xs[:-1] + xs[1:]) / 2
+        row_centers = (ys[:-1] + ys[1:]) / 2
+
+        # Every box edge is a grid line, so each box covers a block of whole cells
+        columns = np.stack(
+            [
+                np.searchsorted(column_centers, forbidden[:, 0], side="left"),
+                np.searchsorted(column_centers, forbidden[:, 2], side="right"),
+            ],
+            axis=1,
+        )
+        rows = np.stack(
+            [
+                np.searchsorted(row_centers, forbidden[:, 1], side="left"),
+                np.searchsorted(row_centers, forbidden[:, 3], side="right"),
+            ],
+            axis=1,
+        )
+        covered = np.zeros((len(row_centers), len(column_centers)), dtype=bool)
+        for (first_column, end_column), (first_row, end_row) in zip(
+            columns.tolist(), rows.tolist()
+        ):
+            covered[first_row:end_row, first_column:end_column] = True
+
+        areas = np.where(covered, 0.0, heights[:, None] * widths[None, :])
+        return xs, ys, np.cumsum(areas.ravel())
+
+    def move_all_random(
+        self,
+        elements: Optional[List[Union[Element, TextElement, ImageElement]]] = None,
+        constrain_to_artboard: bool = False,
+        artboard_margin: Union[int, float] = 0,
+    ) -> np.ndarray:
+        """
+        Moves every element to a random position in one batch, like calling
+        move_random on each of them without collision checks.
+
+        Args:
+            elements: The elements to move; if None, uses self.elements.
+            constrain_to_artboard: If True, constrains the elements to the artboard boundaries.
+            artboard_margin: Margin to apply when constraining to the artboard.
+
+        Returns:
+            The new positions as an (n, 2) array.
+        """
+        if elements is None:
+            elements = self.elements
+        for element in elements:
+            self._validate_element(element)
+
+        count = len(elements)
+        if constrain_to_artboard:
+            if (artboard_margin * 2) >= self.height or (
+                artboard_margin * 2
+            ) >= self.width:
+                raise ValueError("Margin is too large for the artboard dimensions.")
+            boxes = np.array(
+                [element.bounding_box for element in elements], dtype=float
+            ).reshape(count, 4)
+            low = artboard_margin - boxes[:, :2]
+            high = (self.width, self.height) - boxes[:, 2:] - artboard_margin
+        else:
+            low = np.zeros((count, 2))
+            high = np.broadcast_to((self.width, self.height), (count, 2))
+
+        # Drawn from the random module, x then y per element, so a seeded run
+        # places the elements exactly as calling move_random on each would
+        rand = random.random
+        draws = np.array([rand() for _ in range(2 * count)]).reshape(count, 2)
+        positions = low + (high - low) * draws
+
+        # Positions are valid floats by construction, skip the setter
+        for element, (x, y) in zip(elements, positions.tolist()):
+            element._position = (x, y)
+        return positions
+
     def place(self, element: object, position: Tuple[float, float]) -> None:
-        self.add_object(element)
-        self.move(element, position)
+        # Same as add_object then move, validating the element only once
+        self._validate_element(element)
+        self.elements.append(element)
+        element.position = position
 
     def place_random(
         self,
@@ -313,70 +523,132 @@ class Scene:
                 raise Exception(
                     "No objects found in scene to automatically reference from."
                 )
-            reference_element = self.elements[self.element_index(element) - 1]
+            # The element being placed is usually the one added last, which
+            # saves scanning the whole list for it
+            if self.elements[-1] is element:
+                index = len(self.elements) - 1
+            else:
+                index = self.element_index(element)
+            reference_element = self.elements[index - 1]
 
         if max_attempts is None:
             max_attempts = int(max(self.height, self.width))
 
         furthest_distance_incriment = (
-            math.sqrt(self.width**2 + self.height**2) / max_attempts
+            math.hypot(self.width, self.height) / max_attempts
         )
 
-        for attempt_number in range(max_attempts):
-            distance = (attempt_number + 1) * furthest_distance_incriment
+        # Nothing but the candidate position changes between attempts, so
+        # gather the boxes to avoid once and test the attempts in batches
+        bounding_box = element.bounding_box
+        reference_box = np.array(
+            [reference_element.absolute_object_box], dtype=float
+        ).reshape(1, 4)
+        others = np.array(
+            [
+                scene_element.absolute_bounding_box
+                for scene_element in self.elements
+                if scene_element is not element
+                and scene_element.position is not None
+                and not any(coord is None for coord in scene_element.position)
+            ],
+            dtype=float,
+        ).reshape(-1, 4)
+        width, height = self._width, self._height
+        reference_x, reference_y = reference_element.x, reference_element.y
+        if angle is not None:
+            radians = math.radians(angle)
+            direction = (math.cos(radians), math.sin(radians))
+
+        # Batches double in size, so a spot found in the first few attempts
+        # stays cheap while long searches need only a few vectorized checks
+        attempt_number, batch_size = 0, 1
+        while attempt_number < max_attempts:
+            batch_size = min(batch_size, max_attempts - attempt_number)
+            distances = (
+                np.arange(attempt_number + 1, attempt_number + batch_size + 1)
+                * furthest_distance_incriment
+            )
+            attempt_number += batch_size
 
             if angle is None:
-                dx = distance * random.uniform(-1, 1)
-                dy = distance * random.uniform(-1, 1)
+                # dx then dy per attempt, in the same order as drawing them one
+                # by one; -1 + 2 * random() is exactly random.uniform(-1, 1)
+                rand = random.random
+                random_state = random.getstate()
+                directions = np.array(
+                    [-1 + 2 * rand() for _ in range(2 * batch_size)]
+                ).reshape(batch_size, 2)
             else:
-                dx = distance * math.cos(math.radians(angle))
-                dy = distance * math.sin(math.radians(angle))
+                directions = np.array([direction])
+            positions = (reference_x, reference_y) + distances[:, None] * directions
+            candidates = element.calculate_absolute_boxes(positions, bounding_box)
+
+            valid = ~self.are_boxes_touching(
+                candidates, reference_box, minimum_distance
+            )[:, 0]
+            if within_bounds_sctrict:
+                valid &= (
+                    (candidates[:, 0] >= artboard_margin)
+                    & (candidates[:, 1] >= artboard_margin)
+                    & (candidates[:, 2] <= width - artboard_margin)
+                    & (candidates[:, 3] <= height - artboard_margin)
+                )
+            if others.size:
+                valid &= ~self.are_boxes_touching(
+                    candidates, others, minimum_distance
+                ).any(axis=1)
+
+            if valid.any():
+                found = int(valid.argmax())
+                if angle is None:
+                    # Leave the generator where drawing attempt by attempt
+                    # would have, so later random draws keep their seeded values
+                    random.setstate(random_state)
+                    for _ in range(2 * (found + 1)):
+                        rand()
+                element.position = tuple(positions[found].tolist())
+                return True
+
+            batch_size *= 2
 
-            new_position = (reference_element.x + dx, reference_element.y + dy)
-            preview_bounding_box = element.calculate_absolute_box(
-                new_position, element.bounding_box
-            )
+        return False
+
+    def element_vertecies(self) -> np.ndarray:
+        """
+        Returns the absolute vertecies of every element in the scene as one
+        (n, 4, 2) array, rotated in a single batch instead of per element.
+        """
+        if not self.elements:
+            return np.empty((0, 4, 2))
 
-            if within_bounds_sctrict and not self.is_box_inside(
-                preview_bounding_box,
-                self.artboard_box,
-                outside_box_margin=artboard_margin,
-            ):
-                continue
-
-            if self.is_box_touching(
-                preview_bounding_box,
-                reference_element.absolute_object_box,
-                minimum_distance,
-            ):
-                continue
-
-            scene_elements = self.elements
-            # if additional_elements is not None:
-            #     elements.extend(additional_elements)
-
-            touching = False
-            for scene_element in scene_elements:
-                if scene_element is element:
-                    continue
-                if scene_element.position is None or any(
-                    coord is None for coord in scene_element.position
-                ):
-                    continue
-                if self.is_box_touching(
-                    preview_bounding_box,
-                    scene_element.absolute_bounding_box,
-                    minimum_distance,
-                ):
-                    touching = True
-                    break
-            if touching:
-                continue
-
-            element.position = new_position
-            return True
+        for element in self.elements:
+            if element.position is None or element.object_box is None:
+                raise ValueError("Every element needs a position and an object box.")
 
-        return False
+        return Element.calculate_vertecies(
+            [element.object_box for element in self.elements],
+            [element.angle for element in self.elements],
+            [element.position for element in self.elements],
+        )
+
+    def element_bounding_boxes(self) -> np.ndarray:
+        """
+        Returns the absolute bounding boxes of every element in the scene as
+        one (n, 4) array, computed in a single batch instead of per element.
+        """
+        if not self.elements:
+            return np.empty((0, 4))
+
+        for element in self.elements:
+            if element.position is None or element.object_box is None:
+                raise ValueError("Every element needs a position and an object box.")
+
+        return Element.calculate_bounding_boxes(
+            [element.object_box for element in self.elements],
+            [element.angle for element in self.elements],
+            [element.position for element in self.elements],
+        )
 
     def draw_objects(self) -> None:
         """
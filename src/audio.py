@@ -1,6 +1,7 @@
 import os
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 def extract_audio(path: str, overwrite_existing: bool = False) -> str:
     """
@@ -12,9 +13,17 @@ def extract_audio(path: str, overwrite_existing: bool = False) -> str:
     For video files, audio is extracted using FFmpeg with copy mode (no re-encoding).
     """
     # First, probe the file using ffprobe to get stream information.
+    # Only the stream types are needed, so don't ask for (and serialize) the
+    # full stream descriptions.
     try:
         probe = subprocess.run(
-            ["ffprobe", "-v", "error", "-print_format", "json", "-show_streams", path],
+            [
+                "ffprobe",
+                "-v", "error",
+                "-print_format", "json",
+                "-show_entries", "stream=codec_type",
+                path,
+            ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -66,6 +75,25 @@ def extract_audio(path: str, overwrite_existing: bool = False) -> str:
         return None
 
 
+def extract_audio_many(
+    paths: list[str], overwrite_existing: bool = False, max_workers: int = None
+) -> list[str]:
+    """
+    Runs extract_audio over several media files at once and returns the
+    results in the same order as `paths`.
+
+    Each call mostly waits on ffprobe/ffmpeg subprocesses, so threads are
+    enough to overlap them; `max_workers` bounds how many run together
+    (default: one per CPU).
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda path: extract_audio(path, overwrite_existing), paths)
+        )
+
+
 # Example usage:
 def main():
     media_path = input("Enter the media file path: ").strip()
@@ -9,6 +9,10 @@ class ValidationError(ValueError):
     pass
 
 
+# Element types of the most common call: a tuple of numbers such as a position
+_NUMBER_TYPES = (int, float)
+
+
 def validate_collection(
     value: Any,
     collection_type: Optional[Union[Type, Tuple[Optional[Type], ...]]] = tuple,
@@ -32,6 +36,21 @@ def validate_collection(
     Raises:
         ValidationError: if any of the checks fail.
     """
+    # -- Fast path for a tuple of numbers --
+    # Only returns early when every check passes; anything else falls through
+    # to the general checks below so the error messages stay the same.
+    if (
+        collection_type is tuple
+        and element_types == _NUMBER_TYPES
+        and isinstance(value, tuple)
+        and (element_count is None or len(value) == element_count)
+    ):
+        for elem in value:
+            if not isinstance(elem, _NUMBER_TYPES):
+                break
+        else:
+            return
+
     # -- Handle collection_type check --
     # Canonicalize collection_type into a tuple of types, or None
     if collection_type is not None:
@@ -50,3 +50,23 @@ def test_validate_collection_invalid(
             element_count=element_count,
             element_types=element_types,
         )
+
+
+@pytest.mark.parametrize(
+    "value,element_count,valid",
+    [
+        ((1, 2.5), 2, True),
+        ((1, 2.5), None, True),
+        ((True, 2), 2, True),
+        ((1, 2, 3), 2, False),
+        ((1, None), 2, False),
+        ([1, 2], 2, False),
+        ((1, "2"), None, False),
+    ],
+)
+def test_validate_collection_number_tuple(value, element_count, valid):
+    if valid:
+        assert validate_collection(value, tuple, element_count, (int, float)) is None
+    else:
+        with pytest.raises(ValidationError):
+            validate_collection(value, tuple, element_count, (int, float))
@@ -1,4 +1,5 @@
 import os
+import sys
 import srt
 import random
 import subprocess
@@ -70,18 +71,16 @@ def generate_ffmpeg_commands(
             final_command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Combine stdout and stderr
-            text=True,  # Decode output as text
-            bufsize=1, # Line-buffered output
+            bufsize=65536,
         )
 
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                print(output, end='')  # Print output to console
+        # Pass the raw bytes through in whatever chunks are available; read1
+        # returns as soon as there is output, so progress still shows live
+        for chunk in iter(lambda: process.stdout.read1(65536), b''):
+            sys.stdout.buffer.write(chunk)  # Print output to console
+            sys.stdout.buffer.flush()
 
-        return_code = process.poll()
+        return_code = process.wait()
         if return_code == 0:
             print(f"\nVideo generated successfully: {output_video_path}")
         else:
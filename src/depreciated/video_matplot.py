@@ -1,3 +1,6 @@
+from bisect import bisect_right
+from itertools import accumulate
+
 import cv2
 import numpy as np
 import matplotlib.pyplot as plt
@@ -26,30 +29,26 @@ def animate_image_scrolling(image_path, timeline_points, output_path="animated_s
     fig, ax = plt.subplots()
     im = ax.imshow(img_rgb[0:100, 0:100]) #Initial small display so matplotlib doesn't complain about empty data.
 
+    # Frame number at which each timeline point's transition ends
+    ends = list(accumulate(point[2] for point in timeline_points))
+
     def update(frame_num):
         """Updates the frame based on the timeline."""
-        current_point_index = 0
-        total_frames = 0
-
-        for i, point in enumerate(timeline_points):
-            total_frames += point[2]
-            if frame_num < total_frames:
-                current_point_index = i
-                break
+        current_point_index = bisect_right(ends, frame_num)
+        if current_point_index == len(ends):
+            current_point_index = 0
 
         x_start, y_start, frame_count = timeline_points[current_point_index]
 
         if current_point_index == 0:
             prev_x, prev_y = 0, 0 #For the first point, start from (0,0)
+            prev_frame_num = frame_num
         else:
-            prev_x, prev_y, prev_frames = timeline_points[current_point_index-1]
-            total_prev_frames = 0
-            for j in range(current_point_index):
-                total_prev_frames += timeline_points[j][2]
-            prev_frame_num = frame_num - total_prev_frames
-            
-            if prev_frame_num > timeline_points[current_point_index][2]:
-                prev_frame_num = timeline_points[current_point_index][2]
+            prev_x, prev_y, _ = timeline_points[current_point_index-1]
+            prev_frame_num = frame_num - ends[current_point_index-1]
+
+        if prev_frame_num > frame_count:
+            prev_frame_num = frame_count
 
         if frame_count == 0: #If no movement is required for a point, just show the point.
             x = x_start
@@ -1,7 +1,7 @@
 import cv2
 import numpy as np
 import moviepy as mp
-from moviepy import ImageSequenceClip
+from moviepy import VideoClip
 
 def animate_image_scrolling_moviepy(image_path, timeline_points, output_path="animated_scroll_moviepy.mp4", fps=30, visible_width=800, visible_height=600):
     """
@@ -23,14 +23,13 @@ def animate_image_scrolling_moviepy(image_path, timeline_points, output_path="an
     if img is None:
         raise FileNotFoundError(f"Image not found at {image_path}")
 
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)  # Convert to RGB for moviepy.
-
-    height, width, _ = img_rgb.shape
-    frames = []
-    total_duration = 0
+    height, width, _ = img.shape
 
+    # Top-left corner of the visible region for every frame, computed per
+    # transition in one go
+    xs = []
+    ys = []
     for i, (x_start, y_start, duration) in enumerate(timeline_points):
-        total_duration += duration
         num_frames = int(duration * fps)
 
         if i == 0:
@@ -38,19 +37,26 @@ def animate_image_scrolling_moviepy(image_path, timeline_points, output_path="an
         else:
             prev_x, prev_y, _ = timeline_points[i - 1]
 
-        for frame_num in range(num_frames):
-            t = frame_num / fps  # Time within the current transition
-            x = int(prev_x + (x_start - prev_x) * (t / duration))
-            y = int(prev_y + (y_start - prev_y) * (t / duration))
+        t = np.arange(num_frames) / fps  # Time within the current transition
+        xs.append(prev_x + (x_start - prev_x) * (t / duration))
+        ys.append(prev_y + (y_start - prev_y) * (t / duration))
 
-            # Ensure the visible region is within the image bounds
-            x = max(0, min(x, width - visible_width))
-            y = max(0, min(y, height - visible_height))
+    # Ensure the visible region is within the image bounds
+    xs = np.maximum(np.minimum(np.concatenate(xs).astype(int), width - visible_width), 0)
+    ys = np.maximum(np.minimum(np.concatenate(ys).astype(int), height - visible_height), 0)
+    xs = xs.tolist()
+    ys = ys.tolist()
+    frame_count = len(xs)
 
-            visible_region = img_rgb[y:y + visible_height, x:x + visible_width]
-            frames.append(visible_region)
+    def make_frame(t):
+        # Frames are views into img, so nothing is buffered up front; the
+        # reversed channel axis hands moviepy RGB without converting the
+        # whole image
+        i = min(int(round(t * fps)), frame_count - 1)
+        x, y = xs[i], ys[i]
+        return img[y:y + visible_height, x:x + visible_width, ::-1]
 
-    clip = ImageSequenceClip(frames, fps=fps)
+    clip = VideoClip(make_frame, duration=frame_count / fps)
     clip.write_videofile(output_path, fps=fps)
 
 def main():
@@ -1,15 +1,12 @@
 import cv2
 import numpy as np
 import moviepy as mp
-from moviepy import ImageSequenceClip
-from scipy.signal import convolve2d
+from moviepy import VideoClip
 
 def apply_motion_blur(image, kernel_size=5):
     """Applies motion blur to an image."""
-    kernel = np.zeros((kernel_size, kernel_size))
-    kernel[int((kernel_size - 1) / 2), :] = 1
-    kernel = kernel / kernel_size
-    blurred = cv2.filter2D(image, -1, kernel)
+    # A horizontal motion blur kernel is a single row of ones, i.e. a 1-D box
+    blurred = cv2.blur(image, (kernel_size, 1))
     return blurred
 
 def animate_image_scrolling_moviepy_motion_blur(image_path, timeline_points, output_path="animated_scroll_moviepy_blur.mp4", fps=30, visible_width=800, visible_height=600, blur_kernel_size=5):
@@ -33,14 +30,13 @@ def animate_image_scrolling_moviepy_motion_blur(image_path, timeline_points, out
     if img is None:
         raise FileNotFoundError(f"Image not found at {image_path}")
 
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-
-    height, width, _ = img_rgb.shape
-    frames = []
-    total_duration = 0
+    height, width, _ = img.shape
 
+    # Top-left corner of the visible region for every frame, computed per
+    # transition in one go
+    xs = []
+    ys = []
     for i, (x_start, y_start, duration) in enumerate(timeline_points):
-        total_duration += duration
         num_frames = int(duration * fps)
 
         if i == 0:
@@ -48,23 +44,26 @@ def animate_image_scrolling_moviepy_motion_blur(image_path, timeline_points, out
         else:
             prev_x, prev_y, _ = timeline_points[i - 1]
 
-        for frame_num in range(num_frames):
-            t = frame_num / fps
-            x = int(prev_x + (x_start - prev_x) * (t / duration))
-            y = int(prev_y + (y_start - prev_y) * (t / duration))
-
-            x = max(0, min(x, width - visible_width))
-            y = max(0, min(y, height - visible_height))
-
-            visible_region = img_rgb[y:y + visible_height, x:x + visible_width]
-
-            # Apply motion blur (only during movement)
-            if duration > 0: #Do not blur still frames.
-              visible_region = apply_motion_blur(visible_region, blur_kernel_size)
-
-            frames.append(visible_region)
-
-    clip = ImageSequenceClip(frames, fps=fps)
+        t = np.arange(num_frames) / fps
+        xs.append(prev_x + (x_start - prev_x) * (t / duration))
+        ys.append(prev_y + (y_start - prev_y) * (t / duration))
+
+    xs = np.maximum(np.minimum(np.concatenate(xs).astype(int), width - visible_width), 0)
+    ys = np.maximum(np.minimum(np.concatenate(ys).astype(int), height - visible_height), 0)
+    xs = xs.tolist()
+    ys = ys.tolist()
+    frame_count = len(xs)
+
+    def make_frame(t):
+        # Every frame belongs to a transition with a positive duration, so
+        # every frame is blurred
+        i = min(int(round(t * fps)), frame_count - 1)
+        x, y = xs[i], ys[i]
+        visible_region = img[y:y + visible_height, x:x + visible_width]
+        visible_region = apply_motion_blur(visible_region, blur_kernel_size)
+        return visible_region[..., ::-1]  # BGR to RGB for moviepy
+
+    clip = VideoClip(make_frame, duration=frame_count / fps)
     clip.write_videofile(output_path, fps=fps)
 
 # Example usage:
@@ -3,44 +3,47 @@ import re
 import subprocess
 import sys
 
-def parse_time(timestr: str) -> float:
-    """Parses a time string in "HH:MM:SS,mmm" format and returns time in seconds."""
-    hh, mm, ss_ms = timestr.split(":")
-    ss, ms = ss_ms.split(",")
-    return int(hh) * 3600 + int(mm) * 60 + int(ss) + int(ms) / 1000.0
+ENTRY_SEPARATOR = re.compile(r'\n\s*\n')
+TIMING_LINE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})'
+)
 
 def parse_srt(srt_path: str) -> list:
     """
     Parses an SRT file and returns a list of (start, end) intervals in seconds.
     """
     intervals = []
-    with open(srt_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    entries = re.split(r'\n\s*\n', content.strip())
+    with open(srt_path, "rb") as f:
+        content = f.read().decode("utf-8")
+    entries = ENTRY_SEPARATOR.split(content.strip())
     for entry in entries:
         lines = entry.splitlines()
         if len(lines) >= 2:
-            m = re.match(r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})', lines[1])
+            m = TIMING_LINE.match(lines[1])
             if m:
-                start_str, end_str = m.groups()
-                start = parse_time(start_str)
-                end = parse_time(end_str)
+                # The groups are already the numeric fields of both time stamps,
+                # so convert them directly rather than re-splitting the strings
+                hh1, mm1, ss1, ms1, hh2, mm2, ss2, ms2 = map(int, m.groups())
+                start = hh1 * 3600 + mm1 * 60 + ss1 + ms1 / 1000.0
+                end = hh2 * 3600 + mm2 * 60 + ss2 + ms2 / 1000.0
                 intervals.append((start, end))
     return intervals
 
 def build_effective_time_expr(intervals: list) -> str:
     """
     Builds an FFmpeg expression that computes effective time:
-      te = t - ( sum over intervals of: if(t > s, if(t < e, t - s, e - s), 0) )
+      te = t - ( sum over intervals of: clip(t - s, 0, e - s) )
     """
     if not intervals:
         return "t"
     terms = []
     for (s, e) in intervals:
-        # For each interval, if t > s then subtract either (t - s) if still within the interval, or (e - s) if after.
-        term = f"if(gt(t,{s}), if(lt(t,{e}), t-{s}, {e}-{s}), 0)"
+        # For each interval subtract the part of it that has already passed:
+        # 0 before s, t - s inside it and e - s after. The interval length is
+        # a constant here so ffmpeg does not recompute it every frame.
+        term = f"clip(t-{s},0,{e - s})"
         terms.append(term)
-    te_expr = f"t - ({' + '.join(terms)})"
+    te_expr = f"t-({'+'.join(terms)})"
     return te_expr
 
 def process_media(jpg_path: str, srt_path: str, mka_path: str, output_path: str):
@@ -1,12 +1,28 @@
 import math
+import numpy as np
 from typing import Tuple, Optional, Union
 
+_cos = math.cos
+_sin = math.sin
+_TAU = 2 * math.pi
+
 
 class Element:
     """
     Represents a graphical element with position and bounding box.
     """
 
+    __slots__ = (
+        "_position",
+        "_object_box",
+        "_angle",
+        "_cos_a",
+        "_sin_a",
+        "_vertecies_cache",
+        "_bounding_box_cache",
+        "_absolute_bounding_box_cache",
+    )
+
     def __init__(
         self,
         position: Optional[Tuple[Union[int, float], Union[int, float]]] = None,
@@ -27,6 +43,11 @@ class Element:
             position (Optional[Tuple[int, int]]): The (x, y) coordinates of the element.
             object_box (Optional[Tuple[int, int, int, int]]): The bounding box coordinates (left, top, right, bottom).
         """
+        # (inputs..., result) of the last vertex and bounding box computations
+        self._vertecies_cache = None
+        self._bounding_box_cache = None
+        self._absolute_bounding_box_cache = None
+
         self.position = position
         self.object_box = object_box
         self.angle = angle
@@ -37,9 +58,9 @@ class Element:
     @property
     def dict(self) -> dict:
         return {
-            "position": self.position,
-            "object_box": self.object_box,
-            "angle": self.angle,
+            "position": self._position,
+            "object_box": self._object_box,
+            "angle": self._angle,
         }
 
     @property
@@ -55,28 +76,28 @@ class Element:
 
     @property
     def x(self) -> Optional[Union[int, float]]:
-        if not self._position:
+        if self._position is None:
             return None
         return self._position[0]
 
     @x.setter
     def x(self, value: Union[int, float]) -> None:
         self._validate_value(value)
-        if self._position:
+        if self._position is not None:
             self._position = (value, self._position[1])
         else:
             self._position = (value, None)
 
     @property
     def y(self) -> Optional[Union[int, float]]:
-        if not self._position:
+        if self._position is None:
             return None
         return self._position[1]
 
     @y.setter
     def y(self, value: Union[int, float]) -> None:
         self._validate_value(value)
-        if self._position:
+        if self._position is not None:
             self._position = (self._position[0], value)
         else:
             self._position = (None, value)
@@ -118,21 +139,17 @@ class Element:
 
     def _get_object_box_edge(self, index: int) -> Optional[Union[int, float]]:
         """Helper function to get a bounding box coordinate by index."""
-        if not self.object_box:
+        box = self._object_box
+        if box is None:
             return None
-        return self.object_box[index]
+        return box[index]
 
     def _set_object_box_edge(self, index: int, value: Union[int, float]) -> None:
         """Helper function to set a bounding box coordinate by index."""
         self._validate_value(value)
-        if self.object_box:
-            new_object_box = list(self.object_box)
-            new_object_box[index] = value
-            self.object_box = tuple(new_object_box)
-        else:
-            new_object_box = [None, None, None, None]
-            new_object_box[index] = value
-            self.object_box = tuple(new_object_box)
+        # The other edges are already validated, so skip the object_box setter
+        box = self._object_box or (None, None, None, None)
+        self._object_box = box[:index] + (value,) + box[index + 1 :]
         self._fix_object_box()
 
     @property
@@ -168,18 +185,18 @@ class Element:
         self._set_object_box_edge(3, value)
 
     def _fix_object_box(self):
-        if not self._object_box:
+        if self._object_box is None:
             return
 
         left, top, right, bottom = self._object_box
 
-        if left and right:
-            if left > right:
-                left, right = right, left
+        # `is not None` so that edges at 0 are ordered too; one compare per
+        # pair is cheaper than separate min() and max() calls
+        if left is not None and right is not None and left > right:
+            left, right = right, left
 
-        if top and bottom:
-            if top > bottom:
-                top, bottom = bottom, top
+        if top is not None and bottom is not None and top > bottom:
+            top, bottom = bottom, top
 
         self._object_box = (left, top, right, bottom)
 
@@ -192,9 +209,9 @@ class Element:
             Union[int, float],
         ]
     ]:
-        if not self.position:
+        if self._position is None:
             return None
-        if not self.bounding_box:
+        if self._object_box is None:
             return None
 
         return self.calculate_absolute_box(self.position, self.object_box)
@@ -207,16 +224,13 @@ class Element:
         Returns:
             The area of the bounding box, or None if the bounding box is invalid.
         """
-        if not self.object_box:
-            return None
-
-        if any(coord is None for coord in self.object_box):
+        box = self._object_box
+        if box is None or any(coord is None for coord in box):
             return None
 
-        if not all(isinstance(coord, (int, float)) for coord in self.object_box):
-            return None
-
-        return (self.right - self.left) * (self.bottom - self.top)
+        # The setters only ever store ints, floats or None
+        left, top, right, bottom = box
+        return (right - left) * (bottom - top)
 
     def _box_size(
         self,
@@ -273,6 +287,98 @@ class Element:
             bottom + y if bottom is not None else None,
         )
 
+    def calculate_absolute_boxes(
+        self,
+        positions: np.ndarray,
+        box: Tuple[
+            Union[int, float],
+            Union[int, float],
+            Union[int, float],
+            Union[int, float],
+        ],
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_absolute_box: offsets `box` by every position at once.
+
+        Args:
+            positions: (n, 2) array of (x, y) positions.
+            box: (left, top, right, bottom) box to offset.
+
+        Returns:
+            (n, 4) float array of absolute (left, top, right, bottom) boxes.
+        """
+        self._validate_tuple(box, 4, allow_none=False)
+
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 2 or positions.shape[1] != 2:
+            raise ValueError("Positions must be an array of shape (n, 2).")
+
+        return positions[:, [0, 1, 0, 1]] + np.asarray(box, dtype=float)
+
+    @staticmethod
+    def calculate_vertecies(
+        boxes: np.ndarray,
+        angles: np.ndarray,
+        positions: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized vertecies/absolute_vertecies for many elements at once.
+
+        Args:
+            boxes: (n, 4) array of (left, top, right, bottom) object boxes.
+            angles: (n,) array of angles in radians.
+            positions: Optional (n, 2) array of positions; when given the
+                vertecies are absolute.
+
+        Returns:
+            (n, 4, 2) float array of the rotated corners, in the same order as
+            `vertecies`.
+        """
+        boxes = np.asarray(boxes, dtype=float)
+        angles = np.asarray(angles, dtype=float)
+        if boxes.ndim != 2 or boxes.shape[1] != 4:
+            raise ValueError("Boxes must be an array of shape (n, 4).")
+        if angles.shape != boxes.shape[:1]:
+            raise ValueError("Angles must be an array of shape (n,).")
+        # A None angle (unrotated) converts to nan
+        angles = np.where(np.isnan(angles), 0.0, angles)
+
+        # (left, top), (right, top), (right, bottom), (left, bottom)
+        corners = boxes[:, [[0, 1], [2, 1], [2, 3], [0, 3]]]
+
+        cos_a = np.cos(angles)
+        sin_a = np.sin(-angles)
+        rotations = np.stack([cos_a, -sin_a, sin_a, cos_a], axis=-1).reshape(-1, 2, 2)
+        vertecies = np.einsum("nij,nkj->nki", rotations, corners)
+
+        if positions is not None:
+            positions = np.asarray(positions, dtype=float)
+            if positions.shape != (len(boxes), 2):
+                raise ValueError("Positions must be an array of shape (n, 2).")
+            vertecies += positions[:, None, :]
+        return vertecies
+
+    @staticmethod
+    def calculate_bounding_boxes(
+        boxes: np.ndarray,
+        angles: np.ndarray,
+        positions: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized bounding_box/absolute_bounding_box for many elements at once.
+
+        Args:
+            boxes: (n, 4) array of (left, top, right, bottom) object boxes.
+            angles: (n,) array of angles in radians.
+            positions: Optional (n, 2) array of positions; when given the
+                bounding boxes are absolute.
+
+        Returns:
+            (n, 4) float array of (left, top, right, bottom) bounding boxes.
+        """
+        vertecies = Element.calculate_vertecies(boxes, angles, positions)
+        return np.concatenate([vertecies.min(axis=1), vertecies.max(axis=1)], axis=1)
+
     @staticmethod
     def _validate_tuple(
         value: any,
@@ -283,7 +389,7 @@ class Element:
         if value is None and allow_none:
             return  # None is valid
 
-        if not isinstance(value, tuple):
+        if type(value) is not tuple and not isinstance(value, tuple):
             raise ValueError(
                 f"Value must be a tuple."
             )
@@ -293,10 +399,19 @@ class Element:
                 f"Value must be a tuple a length of {members}."
             )
 
-        if not (all(isinstance(coord, (int, float)) for coord in value)):
-            raise ValueError(
-                f"Value must be a tuple of floats, ints, or None."
-            )
+        # Plain loop: no generator frame per call on this hot setter path.
+        # The exact type checks settle plain floats and ints, isinstance is
+        # only reached for subclasses such as bool or NumPy scalars.
+        for coord in value:
+            coord_type = type(coord)
+            if (
+                coord_type is not float
+                and coord_type is not int
+                and not isinstance(coord, (int, float))
+            ):
+                raise ValueError(
+                    f"Value must be a tuple of floats, ints, or None."
+                )
 
     @staticmethod
     def _validate_value(value: any, allow_none: bool = True):
@@ -312,12 +427,16 @@ class Element:
     @angle.setter
     def angle(self, angle: Optional[Union[int, float]]) -> None:
         if angle is None:
-            angle = None
+            self._angle = None
+            self._cos_a, self._sin_a = 1.0, 0.0
             return
 
         if not isinstance(angle, (int, float)):
             raise TypeError("Angle must be an int, float, or None.")
-        self._angle = angle % (2 * math.pi)
+        self._angle = angle % _TAU
+        # Cached for vertecies, which would otherwise recompute them per call
+        self._cos_a = _cos(self._angle)
+        self._sin_a = _sin(self._angle)
 
     @property
     def vertecies(
@@ -330,27 +449,44 @@ class Element:
             Tuple[Union[int, float], Union[int, float]],
         ]
     ]:
-        if self.object_box is None:
+        box = self._object_box
+        if box is None:
             return None
-        self._validate_tuple(self.object_box, 4, False)
-
-        left, top, right, bottom = self.object_box
-        angle = self.angle
-        cos_a = math.cos(angle)
-        sin_a = math.sin(-angle)
-
-        vertecies = (
-            (left, top),
-            (right, top),
-            (right, bottom),
-            (left, bottom),
-        )
-        rotated_vertecies = []
-        for x, y in vertecies:
-            new_x = x * cos_a - y * sin_a
-            new_y = x * sin_a + y * cos_a
-            rotated_vertecies.append((new_x, new_y))
-        return tuple(rotated_vertecies)
+        self._validate_tuple(box, 4, False)
+        return self._vertecies_fast(box)
+
+    def _vertecies_fast(
+        self, box: Tuple[Union[int, float], ...]
+    ) -> Tuple[Tuple[Union[int, float], Union[int, float]], ...]:
+        """vertecies for an already validated, complete `box`; no checks."""
+        # Same identity rule as the bounding box caches: the box and angle
+        # are only ever replaced, so unchanged objects mean unchanged corners
+        angle = self._angle
+        cache = self._vertecies_cache
+        if cache is not None and cache[0] is box and cache[1] is angle:
+            return cache[2]
+
+        left, top, right, bottom = box
+        if angle:  # 0 or None: axis-aligned
+            cos_a = self._cos_a
+            sin_a = -self._sin_a  # rotate by -angle
+            # Spelled out, as a generator would cost more than the arithmetic
+            vertecies = (
+                (left * cos_a - top * sin_a, left * sin_a + top * cos_a),
+                (right * cos_a - top * sin_a, right * sin_a + top * cos_a),
+                (right * cos_a - bottom * sin_a, right * sin_a + bottom * cos_a),
+                (left * cos_a - bottom * sin_a, left * sin_a + bottom * cos_a),
+            )
+        else:
+            vertecies = (
+                (left, top),
+                (right, top),
+                (right, bottom),
+                (left, bottom),
+            )
+
+        self._vertecies_cache = (box, angle, vertecies)
+        return vertecies
 
     @property
     def absolute_vertecies(
@@ -363,12 +499,12 @@ class Element:
             Tuple[Union[int, float], Union[int, float]],
         ]
     ]:
-        px, py = self.position
-        vertecies = self.vertecies
-        absolute_vertecies = []
-        for vx, vy in vertecies:
-            absolute_vertecies.append((vx + px, vy + py))
-        return tuple(absolute_vertecies)
+        px, py = self._position
+        box = self._object_box
+        if box is None:
+            return None
+        self._validate_tuple(box, 4, False)
+        return tuple((vx + px, vy + py) for vx, vy in self._vertecies_fast(box))
 
     @property
     def bounding_box(self) -> Optional[
@@ -379,14 +515,27 @@ class Element:
             Union[int, float],
         ]
     ]:
-        vertecies = self.vertecies
-        if not vertecies:
-            return None
+        # The box and angle are replaced, never mutated, by their setters, so
+        # the cached result is valid while both are the same objects
+        box, angle = self._object_box, self._angle
+        cache = self._bounding_box_cache
+        if cache is not None and cache[0] is box and cache[1] is angle:
+            return cache[2]
 
-        horizontals = [vertex[0] for vertex in vertecies]
-        verticals = [vertex[1] for vertex in vertecies]
+        if box is None:
+            bounding_box = None
+        else:
+            self._validate_tuple(box, 4, False)
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = self._vertecies_fast(box)
+            bounding_box = (
+                min(x0, x1, x2, x3),
+                min(y0, y1, y2, y3),
+                max(x0, x1, x2, x3),
+                max(y0, y1, y2, y3),
+            )
 
-        return (min(horizontals), min(verticals), max(horizontals), max(verticals))
+        self._bounding_box_cache = (box, angle, bounding_box)
+        return bounding_box
 
     @property
     def absolute_bounding_box(self) -> Optional[
@@ -397,7 +546,18 @@ class Element:
             Union[int, float],
         ]
     ]:
-        return self.calculate_absolute_box(self.position, self.bounding_box)
+        position, bounding_box = self._position, self.bounding_box
+        cache = self._absolute_bounding_box_cache
+        if cache is not None and cache[0] is position and cache[1] is bounding_box:
+            return cache[2]
+
+        absolute_bounding_box = self.calculate_absolute_box(position, bounding_box)
+        self._absolute_bounding_box_cache = (
+            position,
+            bounding_box,
+            absolute_bounding_box,
+        )
+        return absolute_bounding_box
 
 
 def __test_angle_normalization(item_count=5):
@@ -415,7 +575,7 @@ def __test_angle_normalization(item_count=5):
     print(element_angles)
 
     result = all(
-        element_angle >= 0 or element_angle <= 2 * math.pi
+        element_angle >= 0 or element_angle <= _TAU
         for element_angle in element_angles
     )
     print(f"Test | Angle Normalization: {result}")
@@ -1,6 +1,6 @@
 import os
 import math
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, ExifTags
 from typing import Tuple, Optional, Union
 
 from .element import Element
@@ -12,6 +12,8 @@ class ImageElement(Element):
     bounding box, angle, and the loaded PIL Image object.
     """
 
+    __slots__ = ("_image_path", "_image", "_processed")
+
     def __init__(
         self,
         image_path: Optional[str] = None,
@@ -31,8 +33,10 @@ class ImageElement(Element):
 
         self._image_path = None
         self._image = None
+        # (image, size, angle) -> resized and rotated RGBA image, see draw()
+        self._processed = None
 
-        if not image:
+        if image is None:
             self.image_path = image_path
         else:
             self.image = image
@@ -62,7 +66,17 @@ class ImageElement(Element):
             return FileNotFoundError(f"FileNotFoundError: {image_path}")
 
         self._image_path = image_path
-        self.image = Image.open(image_path)
+        # Normalize once on load so draw() has nothing left to transpose/convert
+        self.image = self._normalize_image(Image.open(image_path))
+
+    @staticmethod
+    def _normalize_image(image: Image.Image) -> Image.Image:
+        """Applies the EXIF orientation and converts to RGBA, copying only if needed."""
+        if image.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+            image = ImageOps.exif_transpose(image)
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return image
 
     @property
     def image(self):
@@ -83,29 +97,51 @@ class ImageElement(Element):
             self.object_box = image.getbbox()
 
     def draw(self, image: Image) -> None:
-        if self.image is None:
+        source = self._image
+        if source is None:
             raise ValueError("Image not set.")
 
-        _image = ImageOps.exif_transpose(self.image).convert("RGBA")
-
-        # Resize
-        self._validate_tuple(value=self.object_box_size, members=2, allow_none=False)
-        size = tuple(round(dimension) for dimension in self.object_box_size)
-        _image = _image.resize(size=size, resample=Image.Resampling.LANCZOS)
-
-        # Rotate
-        self._validate_value(self.angle, allow_none=False)
-        _image = _image.rotate(
-            math.degrees(self.angle),
-            expand=True,
-            resample=Image.Resampling.BICUBIC,
-        )
+        # Read the slots once; object_box_size would rebuild the bounding box
+        # and validate again on each of its two uses
+        object_box = self._object_box
+        self._validate_tuple(value=object_box, members=4, allow_none=False)
+        left, top, right, bottom = object_box
+        size = (round(right - left), round(bottom - top))
+        angle = self._angle
+        self._validate_value(angle, allow_none=False)
+
+        # Reuse the transformed image while the source, size and angle hold
+        cached = self._processed
+        if (
+            cached is not None
+            and cached[0] is source
+            and cached[1] == size
+            and cached[2] == angle
+        ):
+            _image = cached[3]
+        else:
+            # Already normalized when loaded through image_path
+            _image = self._normalize_image(source)
+
+            # Resize
+            if _image.size != size:
+                _image = _image.resize(size=size, resample=Image.Resampling.LANCZOS)
+
+            # Rotate (PIL would only copy the image for a zero angle)
+            if angle:
+                _image = _image.rotate(
+                    math.degrees(angle),
+                    expand=True,
+                    resample=Image.Resampling.BICUBIC,
+                )
+            self._processed = (source, size, angle, _image)
 
         # Paste
+        absolute_bounding_box = self.absolute_bounding_box
         self._validate_tuple(
-            value=self.absolute_bounding_box, members=4, allow_none=False
+            value=absolute_bounding_box, members=4, allow_none=False
         )
-        box_left, box_top, _, _ = self.absolute_bounding_box
+        box_left, box_top, _, _ = absolute_bounding_box
         paste_pos = (round(box_left), round(box_top))
         image.paste(_image, paste_pos, _image)
 
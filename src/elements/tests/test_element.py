@@ -0,0 +1,104 @@
+import math
+import pytest
+import numpy as np
+from elements import Element
+
+
+def test_calculate_absolute_boxes_matches_scalar():
+    element = Element(position=(0, 0), object_box=(-5, -2, 10, 4), angle=0)
+    positions = np.array([(0, 0), (3.5, -1), (100, 200)])
+    boxes = element.calculate_absolute_boxes(positions, element.object_box)
+    assert boxes.shape == (3, 4)
+    for position, box in zip(positions, boxes):
+        expected = element.calculate_absolute_box(tuple(position), element.object_box)
+        assert tuple(box) == pytest.approx(expected)
+
+
+def test_calculate_absolute_boxes_invalid():
+    element = Element(position=(0, 0), object_box=(0, 0, 1, 1), angle=0)
+    with pytest.raises(ValueError):
+        element.calculate_absolute_boxes(np.zeros((3, 3)), element.object_box)
+    with pytest.raises(ValueError):
+        element.calculate_absolute_boxes(np.zeros((3, 2)), (0, None, 1, 1))
+
+
+def test_object_box_edges_are_ordered():
+    element = Element(position=(0, 0), object_box=(10, 0, 0, -4), angle=0)
+    assert element.object_box == (0, -4, 10, 0)
+
+    element.left = 20
+    assert element.object_box == (10, -4, 20, 0)
+
+
+def test_elements_have_no_instance_dict():
+    from elements import ImageElement
+
+    assert not hasattr(Element(position=(0, 0)), "__dict__")
+    assert not hasattr(ImageElement(), "__dict__")
+
+
+def test_calculate_vertecies_matches_scalar():
+    elements = [
+        Element(position=(3, -2), object_box=(-5, -2, 10, 4), angle=0.3),
+        Element(position=(0, 0), object_box=(0, 0, 1, 1), angle=4),
+        Element(position=(10, 20), object_box=(-1, -1, 1, 1), angle=0),
+    ]
+    vertecies = Element.calculate_vertecies(
+        [element.object_box for element in elements],
+        [element.angle for element in elements],
+        [element.position for element in elements],
+    )
+    assert vertecies.shape == (3, 4, 2)
+    for element, expected in zip(elements, vertecies):
+        assert np.allclose(element.absolute_vertecies, expected)
+
+
+def test_area():
+    assert Element(object_box=(-2, 0, 3, 4)).area == 20
+    assert Element().area is None
+
+
+def test_angle_none_is_unrotated():
+    element = Element(position=(0, 0), object_box=(0, 0, 2, 1), angle=None)
+    assert element.angle is None
+    assert element.vertecies == ((0, 0), (2, 0), (2, 1), (0, 1))
+
+
+def test_bounding_box_cache_follows_changes():
+    element = Element(position=(10, 10), object_box=(0, 0, 4, 2), angle=0)
+    assert element.absolute_bounding_box == pytest.approx((10, 10, 14, 12))
+    assert element.absolute_bounding_box is element.absolute_bounding_box
+
+    element.position = (0, 0)
+    assert element.absolute_bounding_box == pytest.approx((0, 0, 4, 2))
+    element.right = 8
+    assert element.absolute_bounding_box == pytest.approx((0, 0, 8, 2))
+    element.angle = math.pi
+    assert element.absolute_bounding_box == pytest.approx((-8, -2, 0, 0))
+
+
+def test_vertecies_cache_follows_changes():
+    element = Element(position=(0, 0), object_box=(0, 0, 2, 1), angle=0)
+    vertecies = element.vertecies
+    assert element.vertecies is vertecies
+
+    element.right = 4
+    assert element.vertecies == ((0, 0), (4, 0), (4, 1), (0, 1))
+    element.angle = math.pi
+    assert np.allclose(element.vertecies, ((0, 0), (-4, 0), (-4, -1), (0, -1)))
+
+
+def test_calculate_bounding_boxes_matches_scalar():
+    elements = [
+        Element(position=(3, -2), object_box=(-5, -2, 10, 4), angle=0.3),
+        Element(position=(0, 0), object_box=(0, 0, 1, 1), angle=None),
+        Element(position=(10, 20), object_box=(-1, -1, 1, 1), angle=2),
+    ]
+    boxes = Element.calculate_bounding_boxes(
+        [element.object_box for element in elements],
+        [element.angle for element in elements],
+        [element.position for element in elements],
+    )
+    assert boxes.shape == (3, 4)
+    for element, expected in zip(elements, boxes):
+        assert element.absolute_bounding_box == pytest.approx(tuple(expected))
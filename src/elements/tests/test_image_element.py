@@ -0,0 +1,25 @@
+import math
+from PIL import Image
+from elements import ImageElement
+
+
+def _draw(element):
+    canvas = Image.new("RGBA", (100, 100), "white")
+    element.draw(canvas)
+    return canvas.tobytes()
+
+
+def test_draw_reuses_transformed_image():
+    source = Image.linear_gradient("L").convert("RGB").resize((60, 40))
+    element = ImageElement(
+        image=source, position=(50, 50), object_box=(0, -10, 30, 10), angle=math.radians(20)
+    )
+
+    first = _draw(element)
+    processed = element._processed[3]
+    assert _draw(element) == first
+    assert element._processed[3] is processed
+
+    element.angle = math.radians(45)
+    assert _draw(element) != first
+    assert element._processed[3] is not processed
@@ -62,3 +62,24 @@ def test_draw_success(tmp_path):
     # Check pixel change near position
     px = image.getpixel((10,10))
     assert px != (255,255,255)
+
+
+def test_text_bbox_cache_is_bounded_and_skips_variation_fonts(monkeypatch):
+    from elements import text_element
+
+    assert text_element._cached_text_bbox.cache_info().maxsize is not None
+
+    font = ImageFont.load_default(size=20)
+    calls = []
+    measure = text_element._MEASURE_DRAW.textbbox
+
+    def counting_textbbox(*args, **kwargs):
+        calls.append(args)
+        return measure(*args, **kwargs)
+
+    monkeypatch.setattr(text_element._MEASURE_DRAW, "textbbox", counting_textbbox)
+    monkeypatch.setattr(text_element, "_is_variation_font", lambda f: True)
+    text_element._text_bbox(font, "varied", "la", "left")
+    text_element._text_bbox(font, "varied", "la", "left")
+    # Axes can change between calls, so nothing is reused
+    assert len(calls) == 2
@@ -1,9 +1,42 @@
+from functools import lru_cache
 from typing import Tuple, Optional, Union
 from datetime import timedelta
 from PIL import ImageFont, Image, ImageDraw
 
 from .element import Element
 
+# Shared by every TextElement: textbbox() only needs a Draw to measure with
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (0, 0)))
+# (font path, size) -> loaded font, shared by every TextElement
+_FONT_CACHE: dict[tuple, ImageFont.FreeTypeFont] = {}
+
+
+@lru_cache(maxsize=64)
+def _is_variation_font(font: ImageFont.FreeTypeFont) -> bool:
+    try:
+        font.get_variation_axes()
+    except (OSError, NotImplementedError):
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _cached_text_bbox(
+    font: ImageFont.FreeTypeFont, text: str, anchor: str, align: str
+) -> Tuple[int, int, int, int]:
+    return _MEASURE_DRAW.textbbox((0, 0), text, font, anchor=anchor, align=align)
+
+
+def _text_bbox(
+    font: ImageFont.FreeTypeFont, text: str, anchor: str, align: str
+) -> Tuple[int, int, int, int]:
+    """Measures text, reusing earlier results for the same font object."""
+    # set_variation_by_* changes a variable font in place without anything to
+    # key on, so those are always measured afresh
+    if _is_variation_font(font):
+        return _MEASURE_DRAW.textbbox((0, 0), text, font, anchor=anchor, align=align)
+    return _cached_text_bbox(font, text, anchor, align)
+
 
 class TextElement(Element):
     """
@@ -11,6 +44,17 @@ class TextElement(Element):
     start and end times, and font.
     """
 
+    __slots__ = (
+        "text",
+        "padding",
+        "start",
+        "end",
+        "text_alignment",
+        "text_anchor",
+        "text_color",
+        "_font",
+    )
+
     def __init__(
         self,
         text: str,
@@ -97,7 +141,12 @@ class TextElement(Element):
 
     def set_font(self, font_path: str = "calibri.ttf", font_size: float = 11) -> None:
         try:
-            self._font = ImageFont.truetype(font_path, font_size)
+            key = (font_path, font_size)
+            font = _FONT_CACHE.get(key)
+            if font is None:
+                font = ImageFont.truetype(font_path, font_size)
+                _FONT_CACHE[key] = font
+            self._font = font
             self.generate_bounding_box()
         except OSError:
             raise OSError(f"Font not found at {font_path}")
@@ -120,16 +169,9 @@ class TextElement(Element):
         if self.text is None:
             raise ValueError("Text must be set before generating bounding box.")
 
-        temp_image = Image.new("RGB", (0, 0))
-        left, top, right, bottom = ImageDraw.Draw(temp_image).textbbox(
-            (0, 0),
-            self.text,
-            self.font,
-            anchor=self.text_anchor,
-            align=self.text_alignment,
-        )
+        box = _text_bbox(self.font, self.text, self.text_anchor, self.text_alignment)
 
-        self.object_box = (left, top, right, bottom)
+        self.object_box = box
 
     def draw(self, image: Image.Image) -> None:
         """
@@ -32,18 +32,30 @@ def find_files_by_name(
         raise NotADirectoryError(f"Path is not a directory: {directory}")
     
     files_found = set()
-
-    def add_matching_files(dir_path: str, filenames: list):
-        for filename in filenames:
-            full_path = os.path.join(dir_path, filename)
-            if os.path.isfile(full_path) and check_file_name(filename, starts_with, contains, ends_with, match_case, must_pass_all):
-                files_found.add(full_path)
-
-    if search_subdir:
-        for root, _, filenames in os.walk(directory):
-            add_matching_files(root, filenames)
-    else:
-        add_matching_files(directory, os.listdir(directory))
+    # Without any criteria every file matches, skip the per-name check
+    check_names = bool(starts_with or contains or ends_with)
+
+    # scandir reports the entry type from the directory listing itself, so
+    # unlike os.path.isfile there is no extra stat per file
+    directories = [directory]
+    while directories:
+        dir_path = directories.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            if dir_path == directory:
+                raise
+            continue  # Unreadable subdirectory, skipped like os.walk does
+
+        with entries:
+            for entry in entries:
+                if search_subdir and entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.is_file() and (
+                    not check_names
+                    or check_file_name(entry.name, starts_with, contains, ends_with, match_case, must_pass_all)
+                ):
+                    files_found.add(entry.path)
 
     return files_found
 
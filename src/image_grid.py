@@ -9,22 +9,20 @@ def create_image_grid(
     image = Image.new(mode, size, background_color)
     draw = ImageDraw.Draw(image)
 
-    grid_points = []
-    for xn in range((size[0] // grid_size) + 1):
-        for yn in range((size[1] // grid_size) + 1):
-            grid_points.append((xn * grid_size, yn * grid_size))
+    xs = range(0, size[0] + 1, grid_size)
+    ys = range(0, size[1] + 1, grid_size)
 
     # for _ in range(10):
     #     grid_points.append((random.randint(0, size[0]), random.randint(0, size[1])))
 
-    print(grid_points)
-
-    for grid_point in grid_points:
-        x, y = grid_point
+    # Each line once, rather than once per grid point it passes through
+    for x in xs:
         draw.line(((x, 0), (x, size[1])), grid_color)
+    for y in ys:
         draw.line(((0, y), (size[0], y)), grid_color)
 
     if labeled:
+        grid_points = [(x, y) for x in xs for y in ys]
         font = ImageFont.truetype("calibri.ttf")
         for grid_point in grid_points:
             draw.text(
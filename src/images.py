@@ -1,9 +1,22 @@
 import os
 import random
+from functools import lru_cache
 from PIL import Image, ImageOps
 from find_files_by_name import find_files_by_name as find_files
 
 
+@lru_cache(maxsize=512)
+def _prepare_image(image_path: str, image_size: tuple[int, int]) -> Image.Image:
+    """Opens, EXIF-rotates, resizes and converts an image once per (path, size)."""
+    img = Image.open(image_path)
+    # Let libjpeg decode JPEGs at a reduced scale that still covers the target
+    # (a no-op for other formats); the longer side covers either orientation
+    side = max(image_size)
+    img.draft(None, (side, side))
+    img = ImageOps.exif_transpose(img)
+    return img.resize(image_size).convert("RGBA")
+
+
 def place_images_randomly(input_images: list[str], canvas_size: tuple[int, int] = (1000,1000), max_rotation: int = 15, image_size = (100, 100)):
     """
     Places multiple square images at random locations with random rotations.
@@ -18,9 +31,8 @@ def place_images_randomly(input_images: list[str], canvas_size: tuple[int, int]
 
     for image_path in input_images:
         try:
-            img = Image.open(image_path)
-            img = ImageOps.exif_transpose(img)
-            img = img.resize(image_size).convert("RGBA")
+            # Repeated paths reuse the prepared image; only the rotation differs
+            img = _prepare_image(image_path, tuple(image_size))
         except FileNotFoundError:
             print(f"Warning: Image file not found: {image_path}")
             continue
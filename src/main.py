@@ -3,6 +3,19 @@ import random
 import os
 from PIL import Image, ImageDraw, ImageFont
 
+def escape_filter_value(value):
+    """
+    Escapes a string for use as a filter option value inside -filter_complex.
+
+    The value is parsed twice by ffmpeg, once as a filter option and once as
+    part of the filter graph, so both levels of special characters are escaped.
+    """
+    for char in "\\':":
+        value = value.replace(char, "\\" + char)
+    for char in "\\'[],;":
+        value = value.replace(char, "\\" + char)
+    return value
+
 def create_lyric_video(audio_file, lyrics, images, output_video, duration=30, image_count=10, image_size=(100, 100), font_path="arial.ttf", font_size=30):
     """
     Creates a music lyric video with randomly scattered images and text lyrics on a plane.
@@ -43,41 +56,48 @@ def create_lyric_video(audio_file, lyrics, images, output_video, duration=30, im
 
     background.save("background.png")
 
-    # 3. Generate lyric images
-    lyric_images = []
+    # 3. Place the lyrics. Positions are picked in order so seeded runs stay
+    # reproducible; the text itself is drawn by ffmpeg's drawtext filter.
+    # drawtext doesn't search the system font directories, so it gets the
+    # path Pillow resolved (font.path) rather than font_path
     font = ImageFont.truetype(font_path, font_size)
+    measure = ImageDraw.Draw(Image.new("RGBA", (0, 0)))
 
+    text_filters = []
     for i, lyric in enumerate(lyrics):
-        lyric_img = Image.new("RGBA", (width, height), (255, 255, 255, 0))  # Transparent background
-        draw = ImageDraw.Draw(lyric_img)
+        if not lyric.strip():
+            continue  # Nothing to draw; the line's time slot stays empty
 
         # Use textbbox() to get text size
-        left, top, right, bottom = draw.textbbox((0, 0), lyric, font=font)
+        left, top, right, bottom = measure.textbbox((0, 0), lyric, font=font)
         text_width = right - left
         text_height = bottom - top
 
         x = random.randint(0, width - text_width)
         y = random.randint(0, height - text_height)
-        draw.text((x, y), lyric, font=font, fill="black")  # Black text. Adjust as needed.
-        lyric_img.save(f"lyric_{i}.png")
-        lyric_images.append(f"lyric_{i}.png")
+
+        start = i * duration / len(lyrics)
+        end = (i + 1) * duration / len(lyrics)
+        text_filters.append(
+            f"drawtext=fontfile={escape_filter_value(font.path)}"
+            f":text={escape_filter_value(lyric)}:expansion=none"
+            f":x={x}:y={y}:fontsize={font_size}:fontcolor=black"
+            f":enable='between(t,{start},{end})'"
+        )
 
     # 4. Generate the FFMPEG commands
     ffmpeg_commands = [
         "ffmpeg",
         "-loop", "1", "-i", "background.png",  # Static background
+        "-i", audio_file,  # Audio input
     ]
-
-    # Add lyric image inputs and filters
-    for i, lyric_img in enumerate(lyric_images):
-        ffmpeg_commands.extend(["-i", lyric_img])
-        ffmpeg_commands.extend([
-            "-filter_complex",
-            f"[0:v][{i+1}:v]overlay=enable='between(t,{i*duration/len(lyrics)},{(i+1)*duration/len(lyrics)})'",
-        ])
+    if text_filters:
+        ffmpeg_commands.extend(["-filter_complex", "[0:v]" + ",".join(text_filters) + "[v]", "-map", "[v]"])
+    else:
+        ffmpeg_commands.extend(["-map", "0:v"])
 
     ffmpeg_commands.extend([
-        "-i", audio_file,  # Audio input
+        "-map", "1:a",
         "-c:v", "libx264",
         "-pix_fmt", "yuv420p",
         "-c:a", "aac",
@@ -92,9 +112,6 @@ def create_lyric_video(audio_file, lyrics, images, output_video, duration=30, im
     except subprocess.CalledProcessError as e:
         print(f"Error creating video: {e}")
     finally:
-        #cleanup lyric images
-        for lyric_image in lyric_images:
-            os.remove(lyric_image)
         os.remove("background.png")
 
 # Example usage
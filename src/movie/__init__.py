@@ -1,3 +1,4 @@
 from .camera import Camera
-from .render import render
+from .render import render, render_frames, write_video
+from .image import load_image
 from .keyframe import Keyframe
\ No newline at end of file
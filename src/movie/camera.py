@@ -1,9 +1,14 @@
+import bisect
+from operator import attrgetter
+
 import numpy as np
 from .keyframe import Keyframe
+from .pchip import Pchip
 from typing import Tuple, Union, Optional, Callable
-from scipy.interpolate import PchipInterpolator
 from collection_validator import validate_collection
 
+_keyframe_time = attrgetter("time")
+
 
 class Camera:
     def __init__(self):
@@ -11,6 +16,12 @@ class Camera:
         self._zoom_keyframes = []
         self._rotation_keyframes = []
 
+        # Scalar interpolators, built on first use and dropped whenever their
+        # track gets a keyframe
+        self._position_fn = None
+        self._angle_fn = None
+        self._zoom_fn = None
+
     @property
     def position_keyframes(self):
         return self._position_keyframes
@@ -37,18 +48,17 @@ class Camera:
         self,
         time: Union[int, float],
         position: Tuple[Union[float, int], Union[float, int]],
-        sort_keyframes: bool = True,
     ) -> Keyframe:
         """
         Time in seconds.
         Position in x,y.
         """
+        self._position_fn = None
         return self._add_keyframe(
             self._position_keyframes,
             time,
             position,
             element_types=(int, float),
-            sort_keyframes=sort_keyframes,
             normalizer=lambda pos: (float(pos[0]), float(pos[1])),
         )
 
@@ -60,18 +70,17 @@ class Camera:
         self,
         time: Union[int, float],
         angle: Union[float, int],
-        sort_keyframes: bool = True,
     ) -> Keyframe:
         """
         Time in seconds.
         Angle in degrees.
         """
+        self._angle_fn = None
         return self._add_keyframe(
             self._rotation_keyframes,
             time,
             angle,
             element_types=(int, float),
-            sort_keyframes=sort_keyframes,
             normalizer=lambda a: float(a) % 360,
         )
 
@@ -83,18 +92,17 @@ class Camera:
         self,
         time: Union[int, float],
         zoom: Union[float, int],
-        sort_keyframes: bool = True,
     ) -> Keyframe:
         """
         Time in seconds.
         Zoom in multiplier (1 is to scale, >1 is zoom-in, <1 is zoom-out).
         """
+        self._zoom_fn = None
         return self._add_keyframe(
             self._zoom_keyframes,
             time,
             zoom,
             element_types=(int, float),
-            sort_keyframes=sort_keyframes,
             normalizer=lambda z: float(z),
         )
 
@@ -104,25 +112,29 @@ class Camera:
         position: Optional[Tuple[Union[float, int], Union[float, int]]],
         angle: Optional[Union[float, int]],
         zoom: Optional[Union[float, int]],
-        sort_keyframes: bool = True,
     ):
         if position is not None:
-            self.add_position_keyframe(
-                time=time, position=position, sort_keyframes=sort_keyframes
-            )
+            self.add_position_keyframe(time=time, position=position)
 
         if angle is not None:
-            self.add_rotation_keyframe(
-                time=time, angle=angle, sort_keyframes=sort_keyframes
-            )
+            self.add_rotation_keyframe(time=time, angle=angle)
 
         if zoom is not None:
-            self.add_zoom_keyframe(time=time, zoom=zoom, sort_keyframes=sort_keyframes)
+            self.add_zoom_keyframe(time=time, zoom=zoom)
 
     def sort_keyframes(self) -> None:
-        self._position_keyframes.sort(key=lambda keyframe: keyframe.time)
-        self._zoom_keyframes.sort(key=lambda keyframe: keyframe.time)
-        self._rotation_keyframes.sort(key=lambda keyframe: keyframe.time)
+        """
+        Re-sorts every track; only needed after editing keyframe times by hand,
+        since the add_* methods keep the tracks sorted.
+        """
+        self._position_keyframes.sort(key=_keyframe_time)
+        self._zoom_keyframes.sort(key=_keyframe_time)
+        self._rotation_keyframes.sort(key=_keyframe_time)
+
+        # Interpolators built before the re-sort no longer match the tracks
+        self._position_fn = None
+        self._angle_fn = None
+        self._zoom_fn = None
 
     def _add_keyframe(
         self,
@@ -131,19 +143,25 @@ class Camera:
         value,
         *,
         element_types,
-        sort_keyframes: bool = True,
         normalizer=lambda x: x,
     ) -> Keyframe:
         if not isinstance(time, (int, float)):
             raise TypeError("Time must be float or int")
 
         if isinstance(value, (tuple, list)):
-            validate_collection(
-                value=tuple(value),
-                collection_type=tuple,
-                element_count=2,
-                element_types=element_types,
-            )
+            # Check the common valid pair inline; the validator only runs to
+            # raise its detailed error
+            if not (
+                len(value) == 2
+                and isinstance(value[0], element_types)
+                and isinstance(value[1], element_types)
+            ):
+                validate_collection(
+                    value=tuple(value),
+                    collection_type=tuple,
+                    element_count=2,
+                    element_types=element_types,
+                )
         elif not isinstance(value, element_types):
             raise TypeError(
                 f"Value must be one of types {element_types}, got {type(value)}"
@@ -151,19 +169,69 @@ class Camera:
 
         value = normalizer(value)
 
-        for keyframe in keyframes:
-            if keyframe.time == time:
-                keyframe.value = value
-                break
-        else:
+        if not keyframes or time > keyframes[-1].time:
+            # Keyframes are usually added in time order
             keyframe = Keyframe(time=time, value=value)
             keyframes.append(keyframe)
-
-        if sort_keyframes:
-            keyframes.sort(key=lambda keyframe: keyframe.time)
+            return keyframe
+
+        # Tracks stay sorted by time, so the keyframe at `time` (if any) sits
+        # at the insertion point
+        index = bisect.bisect_left(keyframes, time, key=_keyframe_time)
+        if index < len(keyframes) and keyframes[index].time == time:
+            keyframe = keyframes[index]
+            keyframe.value = value
+        else:
+            keyframe = Keyframe(time=time, value=value)
+            keyframes.insert(index, keyframe)
 
         return keyframe
 
+    def _make_vector_interpolator(
+        self,
+        keyframes: list[Keyframe],
+        default_output: Union[float, Tuple[float, float]],
+        axis: Optional[int] = None,
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Build and return a PCHIP interpolator on this keyframe track that accepts
+        an array of times and returns an array of values.
+
+        - keyframes:        list of Keyframe(time:float, value:float or (x,y))
+        - default_output:   what to return when the track has no keyframes
+        - axis:             if the value is vector (x,y), set axis=0 so interp on each component
+                            (Pchip always interpolates along the keyframe axis)
+
+        Output shape is times.shape for scalar tracks, times.shape + (2,) for vector tracks.
+        """
+        if len(keyframes) < 2:
+            # Constant track: the single keyframe's value, or the default
+            constant = np.asarray(
+                keyframes[0].value if keyframes else default_output, dtype=float
+            )
+            return lambda ts: np.full(np.shape(ts) + constant.shape, constant)
+
+        if len(keyframes) == 2:
+            # Pchip through two knots is the straight line (extrapolated the
+            # same way), so skip building the spline
+            first, last = keyframes
+            start = np.asarray(first.value, dtype=float)
+            slope = (np.asarray(last.value, dtype=float) - start) / (
+                last.time - first.time
+            )
+            trailing = (1,) * start.ndim
+
+            def linear(ts):
+                dt = np.asarray(ts, dtype=float) - first.time
+                return start + slope * dt.reshape(dt.shape + trailing)
+
+            return linear
+
+        times = np.array([keyframe.time for keyframe in keyframes], dtype=float)
+        values = np.array([keyframe.value for keyframe in keyframes], dtype=float)
+
+        return Pchip(times, values)
+
     def _make_interpolator(
         self,
         keyframes: list[Keyframe],
@@ -171,7 +239,7 @@ class Camera:
         axis: Optional[int] = None,
     ) -> Callable[[float], Union[float, Tuple[float, float]]]:
         """
-        Build and return a PchipInterpolator on this keyframe track.
+        Build and return a scalar interpolator on this keyframe track.
 
         - keyframes:        list of Keyframe(time:float, value:float or (x,y))
         - default_output:   what to return outside the keyframe range
@@ -180,14 +248,12 @@ class Camera:
         if not keyframes:
             return lambda t: default_output
 
-        keyframes.sort(key=lambda keyframe: keyframe.time)
-        times = np.array([keyframe.time for keyframe in keyframes], dtype=float)
-        values = np.array([keyframe.value for keyframe in keyframes], dtype=float)
+        if len(keyframes) == 1:
+            value = keyframes[0].value
+            value = tuple(value) if axis is not None else float(value)
+            return lambda t: value
 
-        if axis is None:
-            interpolator = PchipInterpolator(times, values, extrapolate=True)
-        else:
-            interpolator = PchipInterpolator(times, values, axis=axis, extrapolate=True)
+        interpolator = self._make_vector_interpolator(keyframes, default_output, axis)
 
         def f(t: float):
             t = float(t)
@@ -208,34 +274,34 @@ class Camera:
         )
 
     def get_position(self, t: float) -> Tuple[float, float]:
-        if not hasattr(self, "_position_fn"):
+        if self._position_fn is None:
             self.make_position_interpolator()
         return self._position_fn(t)
 
+    def _unwrapped_rotation_keyframes(self) -> list[Keyframe]:
+        # Unwrap the angles so every step turns the short way round (350 -> 10
+        # becomes 350 -> 370) and the angle itself can be interpolated
+        angles = np.unwrap(
+            np.array([kf.value for kf in self._rotation_keyframes], dtype=float),
+            period=360,
+        )
+        return [
+            Keyframe(time=kf.time, value=angle)
+            for kf, angle in zip(self._rotation_keyframes, angles.tolist())
+        ]
+
     def make_rotation_interpolator(self) -> None:
-        # Build an (x,y) track from your angle keyframes for uniform rotation
-        xy_keyframes = []
-        for kf in self._rotation_keyframes:
-            θ_rad = np.deg2rad(kf.value)
-            x = np.cos(θ_rad)
-            y = np.sin(θ_rad)
-            xy_keyframes.append(Keyframe(time=kf.time, value=(x, y)))
-
-        # Default unit‐vector at 0° is (1,0)
-        f_xy = self._make_interpolator(
-            keyframes=xy_keyframes, default_output=(1.0, 0.0), axis=0
+        f_unwrapped = self._make_interpolator(
+            keyframes=self._unwrapped_rotation_keyframes(), default_output=0.0
         )
 
         def f(t: float) -> float:
-            x, y = f_xy(t)
-            # atan2(y,x) → radians in [-π,π], convert to [0,360)
-            ang = np.rad2deg(np.arctan2(y, x)) % 360
-            return float(ang)
+            return f_unwrapped(t) % 360
 
         self._angle_fn = f
 
     def get_angle(self, t: float) -> float:
-        if not hasattr(self, "_angle_fn"):
+        if self._angle_fn is None:
             self.make_rotation_interpolator()
         return self._angle_fn(t)
 
@@ -247,6 +313,30 @@ class Camera:
         )
 
     def get_zoom(self, t: float) -> float:
-        if not hasattr(self, "_zoom_fn"):
+        if self._zoom_fn is None:
             self.make_zoom_interpolator()
         return self._zoom_fn(t)
+
+    def sample(
+        self, times: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample every track at all `times` (seconds) in one vectorized pass.
+
+        Returns (positions, angles, zooms) with shapes (n, 2), (n,) and (n,).
+        """
+        times = np.asarray(times, dtype=float)
+
+        positions = self._make_vector_interpolator(
+            self._position_keyframes, default_output=(0.0, 0.0), axis=0
+        )(times)
+
+        angles = self._make_vector_interpolator(
+            self._unwrapped_rotation_keyframes(), default_output=0.0
+        )(times) % 360
+
+        zooms = self._make_vector_interpolator(
+            self._zoom_keyframes, default_output=1.0, axis=None
+        )(times)
+
+        return positions, angles, zooms
@@ -0,0 +1,41 @@
+import cv2
+import os
+import hashlib
+import numpy as np
+from typing import Optional
+
+
+def load_image(image_path: str, cache_dir: Optional[str] = None) -> np.ndarray:
+    """
+    Loads `image_path` as a read-only RGB array, ready to pass to `render`
+    with `is_rgb=True`.
+
+    When `cache_dir` is given, the decoded pixels are saved there as .npy the
+    first time and memory-mapped on later runs, so large backgrounds skip
+    decoding and are paged in from the OS cache on demand. The cache entry is
+    keyed by the image's path, size and modification time.
+    """
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"Image not found at {image_path}")
+
+    cache_path = None
+    if cache_dir is not None:
+        stat = os.stat(image_path)
+        data = f"{os.path.abspath(image_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        key = hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{key}_rgb.npy")
+        if os.path.exists(cache_path):
+            return np.load(cache_path, mmap_mode="r")
+
+    image = cv2.imread(image_path)
+    if image is None:
+        raise ValueError(f"Could not decode image at {image_path}")
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    if cache_path is None:
+        image.flags.writeable = False
+        return image
+
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(cache_path, image)
+    return np.load(cache_path, mmap_mode="r")
@@ -2,27 +2,19 @@ from typing import Any
 
 
 class Keyframe:
-    def __init__(self, time: int = 0, value: Any = None):
-        self.time = time
-        self.value = value
-
-    @property
-    def time(self) -> int:
-        """The time milliseconds of this keyframe."""
-        return self._time
+    """
+    A value at a point in time.
 
-    @time.setter
-    def time(self, t: int):
-        self._time = t
+    Attributes:
+        time: The time of this keyframe.
+        value: The payload or value at this keyframe.
+    """
 
-    @property
-    def value(self) -> Any:
-        """The payload or value at this keyframe."""
-        return self._value
+    __slots__ = ("time", "value")
 
-    @value.setter
-    def value(self, v: Any):
-        self._value = v
+    def __init__(self, time: int = 0, value: Any = None):
+        self.time = time
+        self.value = value
 
 
 def test():
@@ -0,0 +1,107 @@
+import numpy as np
+from typing import Union
+
+
+class Pchip:
+    """
+    Monotone piecewise cubic Hermite interpolator (PCHIP).
+
+    Gives the same curve as scipy's PchipInterpolator(times, values, axis=0,
+    extrapolate=True), but the slopes are computed once up-front and evaluation
+    is a single searchsorted followed by the closed-form Hermite basis.
+    """
+
+    def __init__(self, times: np.ndarray, values: np.ndarray):
+        """
+        Args:
+            times: Strictly increasing knot times, shape (k,).
+            values: Knot values, shape (k,) or (k, d).
+        """
+        self.times = np.asarray(times, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+
+        if self.times.ndim != 1 or len(self.times) < 2:
+            raise ValueError("At least two knot times are required.")
+        if len(self.values) != len(self.times):
+            raise ValueError("Times and values must have the same length.")
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError("Times must be strictly increasing.")
+
+        self.slopes = self._find_slopes(self.times, self.values)
+
+    @staticmethod
+    def _edge_slope(h0, h1, m0, m1):
+        """One-sided three-point slope estimate, limited to keep the end monotone."""
+        d = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+
+        opposite = np.sign(d) != np.sign(m0)
+        overshoot = (np.sign(m0) != np.sign(m1)) & (np.abs(d) > 3 * np.abs(m0))
+
+        d = np.where(opposite, 0.0, d)
+        return np.where(~opposite & overshoot, 3 * m0, d)
+
+    @classmethod
+    def _find_slopes(cls, times: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Fritsch-Carlson slopes (weighted harmonic mean of the secants)."""
+        h = np.diff(times).reshape((-1,) + (1,) * (values.ndim - 1))
+        m = np.diff(values, axis=0) / h
+
+        if len(times) == 2:
+            return np.stack([m[0], m[0]])
+
+        slopes = np.empty_like(values)
+
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        flat = (np.sign(m[1:]) != np.sign(m[:-1])) | (m[1:] == 0) | (m[:-1] == 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic_mean = (w1 + w2) / (w1 / m[:-1] + w2 / m[1:])
+        slopes[1:-1] = np.where(flat, 0.0, harmonic_mean)
+
+        slopes[0] = cls._edge_slope(h[0], h[1], m[0], m[1])
+        slopes[-1] = cls._edge_slope(h[-1], h[-2], m[-1], m[-2])
+        return slopes
+
+    def _intervals(self, t: np.ndarray) -> np.ndarray:
+        """
+        Index of the knot interval used for each query, clipped to the end
+        intervals so that queries outside the knots extrapolate.
+        """
+        times = self.times
+        intervals = len(times) - 1
+
+        if t.ndim == 1 and len(t) > 1 and np.all(t[1:] >= t[:-1]):
+            # Sorted queries (the usual per-frame timeline): find where each
+            # interior knot falls among the queries and repeat the interval
+            # numbers, instead of binary searching every query.
+            bounds = np.searchsorted(t, times[1:-1], side="left")
+            counts = np.diff(bounds, prepend=0, append=len(t))
+            return np.repeat(np.arange(intervals), counts)
+
+        return np.clip(np.searchsorted(times, t, side="right") - 1, 0, intervals - 1)
+
+    def __call__(self, t: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate at time(s) `t`. Outside the knot range the end polynomials are
+        extrapolated. Output shape is t.shape + values.shape[1:].
+        """
+        t = np.asarray(t, dtype=float)
+        times = self.times
+
+        i = self._intervals(t)
+        h = times[i + 1] - times[i]
+        s = (t - times[i]) / h
+
+        # Broadcast the per-query scalars over the value dimensions
+        trailing = (1,) * (self.values.ndim - 1)
+        s = s.reshape(s.shape + trailing)
+        h = h.reshape(h.shape + trailing)
+
+        s2 = s * s
+        s3 = s2 * s
+        return (
+            (2 * s3 - 3 * s2 + 1) * self.values[i]
+            + (s3 - 2 * s2 + s) * h * self.slopes[i]
+            + (3 * s2 - 2 * s3) * self.values[i + 1]
+            + (s3 - s2) * h * self.slopes[i + 1]
+        )
@@ -1,52 +1,260 @@
 import cv2
+import os
+import json
+import hashlib
+import subprocess
+import tempfile
 import numpy as np
+from typing import Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
 from moviepy import AudioFileClip, VideoClip
-from scipy.interpolate import PchipInterpolator
 from .camera import Camera
 
+# Bumped whenever the sampling changes, so stale cached matrices are not reused
+_MATRIX_CACHE_VERSION = 2
+
+
+def affine_matrices(
+    positions: np.ndarray,
+    angles: np.ndarray,
+    zooms: np.ndarray,
+    resolution: tuple[int, int],
+) -> np.ndarray:
+    """
+    Builds the (n, 2, 3) warpAffine matrices for n sampled camera states.
+
+    Equivalent to calling cv2.getRotationMatrix2D((-cx, -cy), angle, zoom) per
+    frame and then shifting the result so the camera position lands in the
+    center of the output, but done for every frame at once.
+    """
+    w, h = resolution
+    cx = positions[:, 0]
+    cy = positions[:, 1]
+
+    theta = np.deg2rad(angles)
+    alpha = zooms * np.cos(theta)
+    beta = zooms * np.sin(theta)
+
+    matrices = np.empty((len(positions), 2, 3), dtype=np.float64)
+    matrices[:, 0, 0] = alpha
+    matrices[:, 0, 1] = beta
+    matrices[:, 0, 2] = w / 2 - alpha * cx - beta * cy
+    matrices[:, 1, 0] = -beta
+    matrices[:, 1, 1] = alpha
+    matrices[:, 1, 2] = h / 2 + beta * cx - alpha * cy
+    return matrices
+
+
+def translation_offsets(
+    matrices: np.ndarray,
+    resolution: tuple[int, int],
+    source_shape: tuple[int, ...],
+    tolerance: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the frames whose matrix is a whole-pixel shift (no rotation, no zoom)
+    that stays inside the source image. Those frames are plain crops, so they
+    can be sliced out of the source instead of resampled by warpAffine.
+
+    Returns (croppable, offsets): a boolean mask of shape (n,) and the integer
+    (left, top) corner of each crop in the source, shape (n, 2).
+    """
+    w, h = resolution
+    source_h, source_w = source_shape[:2]
+
+    shifts = matrices[:, :, 2]
+    offsets = -np.rint(shifts).astype(np.int64)
+
+    croppable = (
+        np.all(np.abs(matrices[:, :, :2] - np.eye(2)) <= tolerance, axis=(1, 2))
+        & np.all(np.abs(shifts + offsets) <= tolerance, axis=1)
+        & (offsets[:, 0] >= 0)
+        & (offsets[:, 1] >= 0)
+        & (offsets[:, 0] + w <= source_w)
+        & (offsets[:, 1] + h <= source_h)
+    )
+    return croppable, offsets
+
+
+def repeated_frames(matrices: np.ndarray, tolerance: float = 1e-6) -> np.ndarray:
+    """
+    Maps each frame to the first frame of the run of matching matrices it
+    belongs to, shape (n,). Frames that differ from their predecessor by more
+    than `tolerance` map to themselves, so a held camera maps every frame of
+    the hold to its first one even when sampling leaves a few ULPs of noise.
+    """
+    n = len(matrices)
+    changed = np.ones(n, dtype=bool)
+    changed[1:] = np.abs(matrices[1:] - matrices[:-1]).max(axis=(1, 2)) > tolerance
+    return np.maximum.accumulate(np.where(changed, np.arange(n), 0))
+
+
+def camera_matrices(
+    camera: Camera,
+    frame_count: int,
+    framerate: float,
+    resolution: tuple[int, int],
+    cache_dir: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Samples the camera once per frame and returns the (n, 2, 3) warp matrices.
+
+    When `cache_dir` is given, the matrices are saved there as .npy under a
+    hash of the keyframes, frame count, framerate and resolution, and loaded
+    back instead of recomputed on later runs with the same inputs.
+    """
+    path = None
+    if cache_dir is not None:
+        tracks = [
+            [(kf.time, kf.value) for kf in keyframes]
+            for keyframes in (
+                camera.position_keyframes,
+                camera.rotation_keyframes,
+                camera.zoom_keyframes,
+            )
+        ]
+        data = json.dumps(
+            [_MATRIX_CACHE_VERSION, tracks, frame_count, framerate, list(resolution)]
+        )
+        key = hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+        path = os.path.join(cache_dir, f"{key}_matrices.npy")
+        if os.path.exists(path):
+            return np.load(path)
+
+    positions, angles, zooms = camera.sample(np.arange(frame_count) / framerate)
+    matrices = affine_matrices(positions, angles, zooms, resolution)
+
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(path, matrices)
+    return matrices
+
+
+def _frame_drawer(
+    big_image: np.ndarray,
+    camera: Camera,
+    resolution: tuple[int, int],
+    framerate: float,
+    cache_dir: Optional[str] = None,
+    is_rgb: bool = False,
+    use_gpu: bool = False,
+):
+    """
+    Does the per-video setup shared by `render` and `render_frames`.
+
+    Returns (frame_count, duration, draw_frame, first_of_run) where
+    draw_frame(i, out=None) produces frame i in RGB, writing into `out` when
+    one is given, and first_of_run is the `repeated_frames` mapping.
+
+    With `use_gpu`, the source is uploaded to the first CUDA device once and
+    warped frames are resampled there with cv2.cuda.warpAffine; whole-pixel
+    crops stay on the CPU. Raises RuntimeError if OpenCV has no CUDA device.
+    """
+    w, h = resolution
+    duration = camera.position_keyframes[-1].time
+
+    # Sample the camera for every frame up-front instead of once per callback
+    frame_count = int(duration * framerate) + 1
+    matrices = camera_matrices(camera, frame_count, framerate, resolution, cache_dir)
+
+    # BGR→RGB for MoviePy once on the source; the warp keeps channel order
+    source = big_image if is_rgb else cv2.cvtColor(big_image, cv2.COLOR_BGR2RGB)
+    croppable, offsets = translation_offsets(matrices, resolution, source.shape)
+
+    # Plain lists index much faster than arrays from the per-frame callback
+    all_croppable = bool(croppable.all())
+    any_croppable = bool(croppable.any())
+    croppable = croppable.tolist()
+    offsets = offsets.tolist()
+
+    def crop_frame(i: int, out: np.ndarray = None) -> np.ndarray:
+        # whole-pixel pans need no resampling, just a crop
+        left, top = offsets[i]
+        crop = source[top : top + h, left : left + w]
+        if out is None:
+            return crop
+        out[...] = crop
+        return out
+
+    if use_gpu:
+        if cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            raise RuntimeError("use_gpu requires OpenCV built with a CUDA device.")
+        gpu_source = cv2.cuda_GpuMat()
+        gpu_source.upload(np.ascontiguousarray(source))
+
+    def gpu_warp_frame(i: int, out: np.ndarray = None) -> np.ndarray:
+        frame = cv2.cuda.warpAffine(
+            gpu_source,
+            matrices[i],
+            (w, h),
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REFLECT,
+        )
+        return frame.download() if out is None else frame.download(out)
+
+    def warp_frame(i: int, out: np.ndarray = None) -> np.ndarray:
+        return cv2.warpAffine(
+            source,
+            matrices[i],
+            (w, h),
+            dst=out,
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REFLECT,
+        )
+
+    if use_gpu:
+        warp_frame = gpu_warp_frame
+
+    def draw_frame(i: int, out: np.ndarray = None) -> np.ndarray:
+        if croppable[i]:
+            return crop_frame(i, out)
+        return warp_frame(i, out)
+
+    # Pick the branch-free drawer when every frame takes the same path
+    if all_croppable:
+        draw_frame = crop_frame
+    elif not any_croppable:
+        draw_frame = warp_frame
+
+    return frame_count, duration, draw_frame, repeated_frames(matrices)
+
+
 def render(
     big_image: np.ndarray,
     camera: Camera,
     resolution: tuple[int, int],
     framerate: float,
     audio_path: str = None,
+    cache_dir: Optional[str] = None,
+    is_rgb: bool = False,
+    use_gpu: bool = False,
 ):
     """
     Returns a MoviePy VideoClip that pans/zooms/rotates around `big_image`
     according to `keyframes`, using cv2.warpAffine for subpixel transforms.
-    """
-    # Unpack keyframe times and params
-
-    # Build smooth, monotonic interpolators
 
+    Warped frames are drawn into one reused buffer, so a frame returned by the
+    clip is only valid until the next one is requested; copy it to keep it.
+    `cache_dir` is passed on to `camera_matrices`. `big_image` is BGR as read
+    by cv2.imread unless `is_rgb` is set (see `load_image`). `use_gpu` warps
+    on a CUDA device (see `_frame_drawer`).
+    """
     w, h = resolution
-    duration = camera.position_keyframes[-1].time
+    frame_count, duration, draw_frame, first_of_run = _frame_drawer(
+        big_image, camera, resolution, framerate, cache_dir, is_rgb, use_gpu
+    )
 
-    def make_frame(t):
-        # 1) sample parameters at time t
-        cx, cy = camera.get_position(t)
-        angle = camera.get_angle(t)  # in degrees
-        zoom = camera.get_zoom(t)  # zoom >1 == “zoom in”
-
-        # 2) build affine matrix via getRotationMatrix2D
-        # start with a rotation+scale about the CENTER of the output image:
-        M = cv2.getRotationMatrix2D((-cx, -cy), angle, zoom)
-
-        # then shift so that that center-of‐frame point in the source
-        # (which currently maps to (w/2,h/2) after R+S) moves to (cx,cy):
-        M[0, 2] += cx - (w / 2)
-        M[0, 2] = -M[0, 2]
-
-        M[1, 2] += cy - (h / 2)
-        M[1, 2] = -M[1, 2]
-
-        # 3) warp
-        out = cv2.warpAffine(
-            big_image, M, (w, h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT
-        )
+    # Frame-coherence cache: held frames reuse the last drawn frame
+    first_of_run = first_of_run.tolist()
+    last = {"index": None, "frame": None}
+    buffer = np.empty((h, w, 3), dtype=big_image.dtype)
 
-        # 4) BGR→RGB for MoviePy
-        return cv2.cvtColor(out, cv2.COLOR_BGR2RGB)
+    def make_frame(t):
+        i = first_of_run[min(int(round(t * framerate)), frame_count - 1)]
+        if i != last["index"]:
+            last["index"] = i
+            last["frame"] = draw_frame(i, out=buffer)
+        return last["frame"]
 
     clip = VideoClip(make_frame, duration=duration)
     clip = clip.with_fps(framerate)
@@ -56,3 +264,133 @@ def render(
         clip = clip.with_audio(audio)
 
     return clip
+
+
+def render_frames(
+    big_image: np.ndarray,
+    camera: Camera,
+    resolution: tuple[int, int],
+    framerate: float,
+    block_size: int = 64,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    is_rgb: bool = False,
+    use_gpu: bool = False,
+) -> Iterator[np.ndarray]:
+    """
+    Renders every frame of the camera move without MoviePy, yielding them in
+    contiguous (n, height, width, 3) RGB blocks of up to `block_size` frames.
+
+    Frames within a block are drawn by `workers` threads (default: one per
+    CPU); cv2.warpAffine and NumPy copies release the GIL, so the frames render
+    in parallel without copying `big_image` into other processes.
+
+    The block buffer is reused between yields, so consume (or copy) each block
+    before asking for the next one. `cache_dir`, `is_rgb` and `use_gpu` work
+    as in `render`.
+    """
+    w, h = resolution
+    frame_count, _, draw_frame, first_of_run = _frame_drawer(
+        big_image, camera, resolution, framerate, cache_dir, is_rgb, use_gpu
+    )
+
+    block = np.empty((min(block_size, frame_count), h, w, 3), dtype=big_image.dtype)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, frame_count, block_size):
+            stop = min(start + block_size, frame_count)
+            sources = first_of_run[start:stop]
+
+            # Only draw frames that start a run, plus the first frame when its
+            # run began in an earlier block; list() waits for them all before
+            # copying
+            drawn = [i for i in range(start, stop) if sources[i - start] == i]
+            if sources[0] < start:
+                drawn.insert(0, start)
+            list(executor.map(lambda i: draw_frame(i, out=block[i - start]), drawn))
+
+            for i in range(start + 1, stop):
+                source = max(sources[i - start], start)
+                if source < i:
+                    block[i - start] = block[source - start]
+            yield block[: stop - start]
+
+
+def write_video(
+    big_image: np.ndarray,
+    camera: Camera,
+    resolution: tuple[int, int],
+    framerate: float,
+    output_path: str,
+    audio_path: str = None,
+    block_size: int = 64,
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    is_rgb: bool = False,
+    use_gpu: bool = False,
+    ffmpeg: str = "ffmpeg",
+    video_codec: str = "libx264",
+) -> None:
+    """
+    Renders the camera move straight into an H.264 file at `output_path`,
+    piping raw RGB frames from `render_frames` into ffmpeg's stdin instead of
+    going through MoviePy's per-frame callback and writer.
+
+    `video_codec` is any ffmpeg H.264 encoder; "h264_nvenc" encodes on an
+    NVIDIA GPU, pairing well with `use_gpu`. The audio track, if given, is
+    muxed in by ffmpeg and cut to the video length. Raises
+    subprocess.CalledProcessError if ffmpeg fails.
+    """
+    w, h = resolution
+    command = [
+        ffmpeg,
+        "-y",
+        "-loglevel", "error",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{w}x{h}",
+        "-r", str(framerate),
+        "-i", "-",
+    ]
+    if audio_path:
+        command.extend(["-i", audio_path, "-c:a", "aac", "-shortest"])
+    command.extend(["-c:v", video_codec, "-pix_fmt", "yuv420p", output_path])
+
+    # stderr goes to a file rather than a pipe, so a chatty encoder can never
+    # block on it while we are blocked writing frames
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+        try:
+            for block in render_frames(
+                big_image,
+                camera,
+                resolution,
+                framerate,
+                block_size=block_size,
+                workers=workers,
+                cache_dir=cache_dir,
+                is_rgb=is_rgb,
+                use_gpu=use_gpu,
+            ):
+                # Blocks are contiguous, so the whole block goes out in one write
+                process.stdin.write(np.ascontiguousarray(block, dtype=np.uint8).data)
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its return code and stderr say why
+        except BaseException:
+            # Rendering failed (or was interrupted): don't leave ffmpeg waiting
+            # on its stdin
+            process.kill()
+            process.wait()
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            raise
+
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stderr=stderr.read()
+            )
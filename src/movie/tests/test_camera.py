@@ -85,3 +85,66 @@ def test_invalid_keyframes():
         cam.add_rotation_keyframe(0.0, 'angle')
     with pytest.raises(TypeError):
         cam.add_zoom_keyframe(0.0, None)
+
+
+def test_keyframes_inserted_in_time_order():
+    cam = Camera()
+    for t in (3.0, 1.0, 2.0, 0.0):
+        cam.add_zoom_keyframe(t, t + 1)
+    kf = cam.add_zoom_keyframe(1.0, 5)
+
+    assert [k.time for k in cam.zoom_keyframes] == [0.0, 1.0, 2.0, 3.0]
+    assert cam.zoom_keyframes[1] is kf
+    assert kf.value == pytest.approx(5.0)
+
+
+def test_getters_follow_new_keyframes():
+    cam = Camera()
+    cam.add_zoom_keyframe(0.0, 1.0)
+    cam.add_zoom_keyframe(2.0, 1.0)
+    assert cam.get_zoom(1.0) == pytest.approx(1.0)
+
+    cam.add_zoom_keyframe(2.0, 3.0)
+    assert cam.get_zoom(1.0) == pytest.approx(2.0)
+
+
+def test_rotation_turns_the_short_way():
+    cam = Camera()
+    cam.add_rotation_keyframe(0.0, 350)
+    cam.add_rotation_keyframe(2.0, 10)
+
+    assert (cam.get_angle(1.0) + 180) % 360 - 180 == pytest.approx(0.0, abs=1e-9)
+    _, angles, _ = cam.sample(np.array([0.5, 1.5]))
+    np.testing.assert_allclose(angles, [355.0, 5.0])
+
+
+def test_short_tracks_match_pchip():
+    from movie.pchip import Pchip
+
+    cam = Camera()
+    cam.add_position_keyframe(1.0, (2, 3))
+    assert cam.get_position(5.0) == (2.0, 3.0)
+    positions, _, _ = cam.sample(np.array([0.0, 4.0]))
+    np.testing.assert_allclose(positions, [[2.0, 3.0], [2.0, 3.0]])
+
+    cam.add_position_keyframe(3.0, (6, -1))
+    ts = np.array([-1.0, 1.0, 2.5, 3.0, 7.0])
+    positions, _, _ = cam.sample(ts)
+    expected = Pchip(np.array([1.0, 3.0]), np.array([[2.0, 3.0], [6.0, -1.0]]))(ts)
+    np.testing.assert_allclose(positions, expected)
+    assert cam.get_position(2.5) == pytest.approx(tuple(expected[2]))
+
+
+def test_sort_keyframes_resets_getters():
+    cam = Camera()
+    cam.add_zoom_keyframe(0.0, 1.0)
+    cam.add_zoom_keyframe(2.0, 3.0)
+    assert cam.get_zoom(1.0) == pytest.approx(2.0)
+
+    # Swap the times by hand, then re-sort
+    first, last = cam.zoom_keyframes
+    first.time, last.time = 2.0, 0.0
+    cam.sort_keyframes()
+
+    assert cam.get_zoom(1.0) == pytest.approx(2.0)
+    assert cam.get_zoom(0.0) == pytest.approx(3.0)
@@ -0,0 +1,23 @@
+import cv2
+import pytest
+import numpy as np
+from movie import load_image
+
+
+def test_load_image_caches_rgb(tmp_path):
+    bgr = np.random.default_rng(0).integers(0, 255, (20, 30, 3), dtype=np.uint8)
+    image_path = str(tmp_path / "big.png")
+    cv2.imwrite(image_path, bgr)
+    cache_dir = tmp_path / "cache"
+
+    for _ in range(2):  # decode, then memory-map
+        image = load_image(image_path, str(cache_dir))
+        assert np.array_equal(image, bgr[:, :, ::-1])
+        assert not image.flags.writeable
+    assert isinstance(image, np.memmap)
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_load_image_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_image(str(tmp_path / "missing.png"))
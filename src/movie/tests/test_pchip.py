@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+from movie.pchip import Pchip
+
+
+@pytest.mark.parametrize("knot_count", [2, 3, 5, 12])
+@pytest.mark.parametrize("value_shape", [(), (2,)])
+def test_matches_scipy_pchip(knot_count, value_shape):
+    rng = np.random.default_rng(knot_count)
+    times = np.sort(rng.choice(np.arange(0, 50, 0.5), knot_count, replace=False))
+    values = np.round(rng.normal(size=(knot_count,) + value_shape))
+    query = np.linspace(times[0] - 2, times[-1] + 2, 101)
+
+    expected = PchipInterpolator(times, values, axis=0, extrapolate=True)(query)
+    result = Pchip(times, values)(query)
+
+    assert result.shape == expected.shape
+    assert np.allclose(result, expected)
+
+
+def test_scalar_query_and_knots():
+    pchip = Pchip([0.0, 1.0, 3.0], [(0, 0), (2, 4), (2, 8)])
+    assert pchip(1.0).shape == (2,)
+    assert np.allclose(pchip(3.0), (2, 8))
+
+
+def test_invalid_knots():
+    with pytest.raises(ValueError):
+        Pchip([0.0], [1.0])
+    with pytest.raises(ValueError):
+        Pchip([1.0, 0.0], [1.0, 2.0])
+
+
+def test_sorted_and_shuffled_queries_agree():
+    rng = np.random.default_rng(0)
+    pchip = Pchip([0.0, 1.0, 1.5, 4.0], [0.0, 3.0, 1.0, 2.0])
+    query = np.sort(np.concatenate([rng.uniform(-1, 5, 50), [0.0, 1.0, 1.5, 4.0]]))
+    order = rng.permutation(len(query))
+
+    assert np.allclose(pchip(query)[order], pchip(query[order]))
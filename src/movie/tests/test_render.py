@@ -0,0 +1,114 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from movie import Camera, write_video
+from movie.render import camera_matrices, render_frames, repeated_frames
+
+
+def _stub_encoder(tmp_path, body):
+    """An executable standing in for ffmpeg; its last argument is the output path."""
+    path = tmp_path / "encoder"
+    path.write_text(f"#!{sys.executable}\nimport os, sys\n{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_repeated_frames_maps_holds_to_first_frame():
+    matrices = np.zeros((6, 2, 3))
+    matrices[2:4, 0, 2] = 1.0
+    matrices[5, 1, 2] = 2.0
+
+    assert repeated_frames(matrices).tolist() == [0, 0, 2, 2, 4, 5]
+
+
+def test_repeated_frames_ignores_sampling_noise():
+    matrices = np.zeros((4, 2, 3))
+    matrices[:, 0, 2] = 1234.5 + np.array([0, 1, -1, 2]) * 1e-12
+    matrices[3, 1, 2] = 0.5
+
+    assert repeated_frames(matrices).tolist() == [0, 0, 0, 3]
+
+
+def test_render_frames_draws_held_runs_once_per_block(monkeypatch):
+    render_module = sys.modules["movie.render"]
+    drawer = render_module._frame_drawer
+    drawn = []
+
+    def counting_drawer(*args):
+        frame_count, duration, draw_frame, first_of_run = drawer(*args)
+
+        def draw(i, out=None):
+            drawn.append(i)
+            return draw_frame(i, out)
+
+        return frame_count, duration, draw, first_of_run
+
+    monkeypatch.setattr(render_module, "_frame_drawer", counting_drawer)
+    big_image = np.random.default_rng(0).integers(0, 255, (120, 160, 3), np.uint8)
+    camera = Camera()
+    camera.add_keyframe(0, (80.3, 60.7), 10, 1.5)
+    camera.add_keyframe(2, (80.3, 60.7), 10, 1.5)
+
+    blocks = [b.copy() for b in render_frames(big_image, camera, (32, 18), 10, 8)]
+
+    assert drawn == [0, 8, 16]  # 21 held frames over three blocks
+    frames = np.concatenate(blocks)
+    assert len(frames) == 21
+    assert (frames == frames[0]).all()
+
+
+def test_camera_matrices_cache(tmp_path):
+    camera = Camera()
+    camera.add_keyframe(0, (10, 20), 0, 1)
+    camera.add_keyframe(2, (50, 80), 90, 2)
+    expected = camera_matrices(camera, 21, 10, (160, 90))
+
+    for _ in range(2):  # miss, then hit
+        cached = camera_matrices(camera, 21, 10, (160, 90), str(tmp_path))
+        assert np.array_equal(cached, expected)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    camera.add_zoom_keyframe(2, 3)
+    camera_matrices(camera, 21, 10, (160, 90), str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_write_video_kills_encoder_when_rendering_fails(tmp_path, monkeypatch):
+    encoder = _stub_encoder(tmp_path, "sys.stdin.buffer.read()")  # waits like ffmpeg
+    processes = []
+
+    class RecordingPopen(subprocess.Popen):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            processes.append(self)
+
+    monkeypatch.setattr(subprocess, "Popen", RecordingPopen)
+    image = np.zeros((20, 20, 3), dtype=np.uint8)
+
+    with pytest.raises(IndexError):  # no position keyframes
+        write_video(image, Camera(), (8, 8), 10, str(tmp_path / "out.mp4"), ffmpeg=encoder)
+
+    assert len(processes) == 1
+    assert processes[0].returncode is not None
+
+
+def test_write_video_reports_encoder_stderr(tmp_path):
+    # More stderr than a pipe buffer holds, written before reading any frames
+    encoder = _stub_encoder(
+        tmp_path,
+        "sys.stderr.write('x' * 200000)\nsys.stdin.buffer.read()\nsys.exit(3)",
+    )
+    camera = Camera()
+    camera.add_position_keyframe(0, (150, 150))
+    camera.add_position_keyframe(1, (152, 150))
+    image = np.zeros((300, 300, 3), dtype=np.uint8)
+
+    # ~1.3 MB of frames, far more than the stdin pipe buffers either
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        write_video(
+            image, camera, (200, 200), 10, str(tmp_path / "out.mp4"), ffmpeg=encoder
+        )
+    assert error.value.returncode == 3
+    assert len(error.value.stderr) == 200000
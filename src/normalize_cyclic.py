@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 
 def normalize_cyclic(value, min, max):
@@ -8,6 +9,15 @@ def normalize_cyclic(value, min, max):
     return value % (deviation) + min
 
 
+def normalize_cyclic_array(values, min, max):
+    """normalize_cyclic for a whole array of values at once."""
+    values = np.asarray(values, dtype=float)
+    deviation = max - min
+    if deviation == 0:
+        return np.full_like(values, min)
+    return np.mod(values, deviation) + min
+
+
 def get_error_rate(value, expected_value):
     return abs(value - expected_value) / (expected_value + 1e-308)
 
@@ -39,6 +49,11 @@ def main():
         )
         if not remark:
             check = False
+
+    for value, min, max, _ in tests:
+        batched = normalize_cyclic_array([value, value], min, max)
+        if not np.allclose(batched, normalize_cyclic(value, min, max)):
+            check = False
     print(check)
 
 
@@ -1,6 +1,13 @@
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=256)
+def _lowered(*needles: Optional[str]) -> tuple:
+    # The same criteria are usually checked against many strings
+    return tuple(needle.lower() if needle else None for needle in needles)
+
+
 def string_content_check(
         input_string: str,
         starts_with: Optional[str] = None,
@@ -45,26 +52,23 @@ def string_content_check(
 
     if not match_case:
         input_string = input_string.lower()
-        starts_with = starts_with.lower() if starts_with else None
-        contains = contains.lower() if contains else None
-        ends_with = ends_with.lower() if ends_with else None
-
-    checks = set()
-
-    
-    if starts_with:
-        checks.add(input_string.startswith(starts_with))
-
-    if contains:
-        checks.add(contains in input_string)
-
-    if ends_with:
-        checks.add(input_string.endswith(ends_with))
+        starts_with, contains, ends_with = _lowered(starts_with, contains, ends_with)
 
     if must_pass_all:
-        return all(checks)
-
-    return any(checks) if checks else True
+        return (
+            (not starts_with or input_string.startswith(starts_with))
+            and (not contains or contains in input_string)
+            and (not ends_with or input_string.endswith(ends_with))
+        )
+
+    if not (starts_with or contains or ends_with):
+        return True
+
+    return bool(
+        (starts_with and input_string.startswith(starts_with))
+        or (contains and contains in input_string)
+        or (ends_with and input_string.endswith(ends_with))
+    )
 
 
 def main():
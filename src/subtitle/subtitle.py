@@ -15,7 +15,7 @@ def get_subtitles(srt_file_path: str) -> List[srt.Subtitle]:
 
     Raises:
         FileNotFoundError: If the SRT file is not found.
-        UnicodeDecodeError: If the SRT file cannot be decoded with UTF-8.
+        UnicodeDecodeError: If the SRT file is neither UTF-8 nor Windows-1252.
         srt.SRTParseError: If the SRT file has parsing errors.
         OSError: For other file-related errors.
     """
@@ -24,21 +24,17 @@ def get_subtitles(srt_file_path: str) -> List[srt.Subtitle]:
     if not srt_file_path.endswith('.srt'):
         raise ValueError("Invalid file path. Expected a file with '.srt' extension.")
 
+    with open(srt_file_path, 'rb') as file:
+        srt_bytes = file.read()
+
+    # Files saved on Windows are often UTF-8 with a byte order mark, or not
+    # UTF-8 at all
     try:
-        with open(srt_file_path, 'r', encoding='utf-8') as file:
-            srt_data = file.read()
-        return list(srt.parse(srt_data))
-
-    except FileNotFoundError as e:
-        raise FileNotFoundError(f"SRT file not found: {srt_file_path}") from e
-    except UnicodeDecodeError as e:
-        raise UnicodeDecodeError(f"Error decoding SRT file: {srt_file_path}. Ensure it's UTF-8 encoded.") from e
-    except srt.SRTParseError as e:
-        raise srt.SRTParseError(f"Error parsing SRT file: {srt_file_path}. Invalid SRT format.") from e
-    except OSError as e:
-        raise OSError(f"Error reading SRT file: {srt_file_path}. {e}") from e
-    except Exception as e:
-        raise Exception(f"An unexpected error occurred while processing {srt_file_path}: {e}") from e
+        srt_data = srt_bytes.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        srt_data = srt_bytes.decode('cp1252')
+
+    return list(srt.parse(srt_data))
 
 
 def main():
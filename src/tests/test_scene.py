@@ -0,0 +1,192 @@
+import math
+import random
+
+import numpy as np
+import pytest
+from Scene import Scene
+from elements import Element
+
+
+def _crowded_scene():
+    scene = Scene(200, 100)
+    for position in [(30, 20), (90, 50), (150, 30), (60, 80), (170, 85)]:
+        scene.add_object(Element(position=position, object_box=(-20, -12, 20, 12)))
+    return scene
+
+
+def test_move_random_collision_placements_are_free():
+    random.seed(1)
+    scene = _crowded_scene()
+    # Lopsided box, so growing the obstacles by it is direction-sensitive
+    element = Element(position=(0, 0), object_box=(-4, -9, 14, 3), angle=0)
+    scene.add_object(element)
+    others = [e.absolute_bounding_box for e in scene.elements if e is not element]
+
+    placed = 0
+    for _ in range(300):
+        position = scene.move_random(
+            element,
+            constrain_to_artboard=True,
+            artboard_margin=2,
+            collision=True,
+            minimum_distance=3,
+        )
+        if position is None:
+            continue
+        placed += 1
+        box = element.absolute_bounding_box
+        assert Scene.is_box_inside(box, scene.artboard_box, outside_box_margin=2)
+        assert not any(Scene.is_box_touching(box, other, 3) for other in others)
+    assert placed > 250
+
+
+def test_move_random_degenerate_axis():
+    random.seed(2)
+    scene = Scene(100, 100)
+    scene.add_object(Element(position=(50, 30), object_box=(-50, -30, 50, 30)))
+    # Exactly as wide as the artboard, so x has a single valid value
+    element = Element(position=(0, 0), object_box=(-50, -5, 50, 5), angle=0)
+
+    for _ in range(50):
+        x, y = scene.move_random(
+            element, constrain_to_artboard=True, collision=True, minimum_distance=1
+        )
+        assert x == 50
+        assert 66 < y <= 95
+
+
+def test_move_random_returns_none_without_free_area():
+    random.seed(3)
+    scene = Scene(100, 100)
+    scene.add_object(Element(position=(50, 50), object_box=(-50, -50, 50, 50)))
+    element = Element(position=(10, 10), object_box=(-5, -5, 5, 5), angle=0)
+
+    assert (
+        scene.move_random(element, constrain_to_artboard=True, collision=True)
+        is None
+    )
+    assert element.position == (10, 10)
+
+
+def test_are_boxes_touching_matches_is_box_touching():
+    rng = np.random.default_rng(4)
+    # Integer corners so that boxes sharing an edge exactly are common
+    corners = rng.integers(0, 20, size=(2, 40, 2, 2))
+    boxes1, boxes2 = (
+        np.concatenate([c.min(axis=1), c.max(axis=1)], axis=1) for c in corners
+    )
+
+    for minimum_distance in (0, 2.5):
+        touching = Scene.are_boxes_touching(boxes1, boxes2, minimum_distance)
+        assert touching.shape == (40, 40)
+        for i, box1 in enumerate(boxes1.tolist()):
+            for j, box2 in enumerate(boxes2.tolist()):
+                assert touching[i, j] == Scene.is_box_touching(
+                    box1, box2, minimum_distance
+                )
+
+
+def _baseline_move_next(scene, element, reference_element, minimum_distance):
+    """move_next as a plain loop over single attempts, without batching."""
+    max_attempts = int(max(scene.height, scene.width))
+    increment = math.sqrt(scene.width**2 + scene.height**2) / max_attempts
+
+    for attempt_number in range(max_attempts):
+        distance = (attempt_number + 1) * increment
+        dx = distance * random.uniform(-1, 1)
+        dy = distance * random.uniform(-1, 1)
+        position = (reference_element.x + dx, reference_element.y + dy)
+        box = element.calculate_absolute_box(position, element.bounding_box)
+
+        if not Scene.is_box_inside(box, scene.artboard_box):
+            continue
+        if Scene.is_box_touching(
+            box, reference_element.absolute_object_box, minimum_distance
+        ):
+            continue
+        if any(
+            Scene.is_box_touching(box, other.absolute_bounding_box, minimum_distance)
+            for other in scene.elements
+            if other is not element
+        ):
+            continue
+        return position
+    return None
+
+
+def _baseline_set_position(element, position):
+    if position is None:
+        return False
+    element.position = position
+    return True
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_move_next_matches_baseline_loop(seed):
+    scene = _crowded_scene()
+    reference = scene.elements[1]
+    element = Element(position=(0, 0), object_box=(-15, -6, 15, 6), angle=0)
+    scene.add_object(element)
+
+    random.seed(seed)
+    expected = _baseline_move_next(scene, element, reference, 4)
+
+    random.seed(seed)
+    assert scene.move_next(element, reference, minimum_distance=4)
+    assert element.position == pytest.approx(expected, abs=1e-9)
+
+
+def test_move_next_sequence_matches_baseline_loop():
+    # Each call must leave the generator where the plain loop would, or the
+    # placements after the first one drift from their seeded values
+    def place(move):
+        scene = _crowded_scene()
+        placed = []
+        for _ in range(3):
+            element = Element(position=(0, 0), object_box=(-15, -6, 15, 6), angle=0)
+            scene.add_object(element)
+            placed.append((move(scene, element, scene.elements[-2]), element.position))
+        return placed, random.random()
+
+    for seed in range(20):
+        random.seed(seed)
+        expected = place(
+            lambda scene, element, reference: _baseline_set_position(
+                element, _baseline_move_next(scene, element, reference, 4)
+            )
+        )
+
+        random.seed(seed)
+        actual = place(
+            lambda scene, element, reference: scene.move_next(
+                element, reference, minimum_distance=4
+            )
+        )
+        for (moved, position), (expected_moved, expected_position) in zip(
+            actual[0], expected[0]
+        ):
+            assert moved == expected_moved
+            assert position == pytest.approx(expected_position, abs=1e-9)
+        assert actual[1] == expected[1]
+
+
+def test_move_all_random_stays_on_artboard_and_follows_seed():
+    scene = Scene(200, 100)
+    for object_box in [(-10, -5, 10, 5), (-3, -20, 30, 2), (0, 0, 50, 40)]:
+        scene.add_object(Element(position=(0, 0), object_box=object_box))
+
+    random.seed(5)
+    positions = scene.move_all_random(constrain_to_artboard=True, artboard_margin=4)
+    assert positions.shape == (3, 2)
+    for element in scene.elements:
+        assert Scene.is_box_inside(
+            element.absolute_bounding_box, scene.artboard_box, outside_box_margin=4
+        )
+
+    # Same draws as moving the elements one by one
+    random.seed(5)
+    expected = [
+        scene.move_random(element, constrain_to_artboard=True, artboard_margin=4)
+        for element in scene.elements
+    ]
+    np.testing.assert_allclose(positions, expected)